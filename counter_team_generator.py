@@ -14,9 +14,10 @@ Counter Strategy (0-100 confidence):
     Counter-Team Scoring: Rates effectiveness against enemy
 """
 
+import heapq
 from typing import List, Dict, Tuple, Optional
-from collections import Counter
-from team_optimizer import Cookie, Team, TeamOptimizer
+from collections import Counter, OrderedDict
+from team_optimizer import Cookie, Team, TeamOptimizer, Treasure
 from meta_teams_database import (
     analyze_enemy_team_threats,
     recommend_counter_team,
@@ -26,34 +27,291 @@ from meta_teams_database import (
 )
 
 
-# Special cookie categories for counter detection
-BEAST_COOKIES = ['Shadow Milk Cookie', 'Eternal Sugar Cookie', 'Mystic Flour Cookie',
-                 'Burning Spice Cookie', 'Silent Salt Cookie']
-
-ANTI_HEAL_COOKIES = ['Poison Mushroom Cookie', 'Pumpkin Pie Cookie', 'Stardust Cookie',
-                     'Pitaya Dragon Cookie', 'White Lily Cookie']
-
-DEFENSE_SHRED_COOKIES = ['Dark Choco Cookie', 'Candy Apple Cookie', 'Black Lemonade Cookie']
-
-AMBUSH_ASSASSINS = ['Shadow Milk Cookie', 'Vampire Cookie', 'Wind Archer Cookie',
-                    'Stormbringer Cookie']
-
-IMMUNITY_PROVIDERS = ['Cream Ferret Cookie', 'Seltzer Cookie', 'Pure Vanilla Cookie']
-
-TAUNT_TANKS = ['Elder Faerie Cookie', 'Wildberry Cookie', 'Dark Cacao Cookie',
-               'Milk Cookie', 'Knight Cookie']
-
-CROWD_CONTROL_COOKIES = ['Frost Queen Cookie', 'Silent Salt Cookie', 'Sea Fairy Cookie',
-                         'Shadow Milk Cookie']
-
-BURST_DAMAGE_COOKIES = ['Burning Spice Cookie', 'Tarte Tatin Cookie', 'Wind Archer Cookie',
-                        'Black Pearl Cookie']
-
-CLEANSE_COOKIES = ['Cream Ferret Cookie', 'Pure Vanilla Cookie', 'Peppermint Cookie',
-                   'Sparkling Cookie']
+# Special cookie categories for counter detection (frozensets for O(1) membership tests)
+BEAST_COOKIES = frozenset({'Shadow Milk Cookie', 'Eternal Sugar Cookie', 'Mystic Flour Cookie',
+                           'Burning Spice Cookie', 'Silent Salt Cookie'})
+
+ANTI_HEAL_COOKIES = frozenset({'Poison Mushroom Cookie', 'Pumpkin Pie Cookie', 'Stardust Cookie',
+                               'Pitaya Dragon Cookie', 'White Lily Cookie'})
+
+DEFENSE_SHRED_COOKIES = frozenset({'Dark Choco Cookie', 'Candy Apple Cookie', 'Black Lemonade Cookie'})
+
+AMBUSH_ASSASSINS = frozenset({'Shadow Milk Cookie', 'Vampire Cookie', 'Wind Archer Cookie',
+                              'Stormbringer Cookie'})
+
+IMMUNITY_PROVIDERS = frozenset({'Cream Ferret Cookie', 'Seltzer Cookie', 'Pure Vanilla Cookie'})
+
+# Priority order is kept in a tuple where recommendations are taken from the list
+_TAUNT_TANKS_ORDERED = ('Elder Faerie Cookie', 'Wildberry Cookie', 'Dark Cacao Cookie',
+                        'Milk Cookie', 'Knight Cookie')
+TAUNT_TANKS = frozenset(_TAUNT_TANKS_ORDERED)
+
+CROWD_CONTROL_COOKIES = frozenset({'Frost Queen Cookie', 'Silent Salt Cookie', 'Sea Fairy Cookie',
+                                   'Shadow Milk Cookie'})
+
+BURST_DAMAGE_COOKIES = frozenset({'Burning Spice Cookie', 'Tarte Tatin Cookie', 'Wind Archer Cookie',
+                                  'Black Pearl Cookie'})
+
+CLEANSE_COOKIES = frozenset({'Cream Ferret Cookie', 'Pure Vanilla Cookie', 'Peppermint Cookie',
+                             'Sparkling Cookie'})
+
+_HIGH_HP_TANKS_ORDERED = ('Millennial Tree Cookie', 'Hollyberry Cookie', 'Dark Cacao Cookie',
+                          'Elder Faerie Cookie')
+HIGH_HP_TANKS = frozenset(_HIGH_HP_TANKS_ORDERED)
+
+# Role and rarity groupings used by the counter checks
+_HEALER_ROLES = frozenset({'Healing', 'Support'})
+_TANK_ROLES = frozenset({'Defense', 'Charge'})
+_DPS_ROLES = frozenset({'Magic', 'Ranged', 'Bomber', 'Ambush'})
+_HIGH_TIER_RARITIES = frozenset({'Beast', 'Ancient', 'Legendary'})
+
+# Section rule for explain_counter and main() output
+_SEP60 = '=' * 60
+
+# Maximum number of enemy analyses kept in CounterTeamGenerator's cache
+_ANALYSIS_CACHE_SIZE = 128
+
+# Maximum number of (counter team, enemy team) scoring results kept (LRU)
+_SCORE_CACHE_SIZE = 32
+
+# Base treasure score by tier for recommend_counter_treasures (unknown tiers score 2.0)
+_TIER_BASE = {'S+': 10.0, 'S': 8.0, 'A': 6.0, 'B': 4.0, 'C': 2.0}
+
+# Per-cookie ability flags used by analyze_enemy_team
+_HEALER = 1 << 0            # Healing/Support role or provides healing
+_TANK = 1 << 1              # Defense/Charge role
+_DPS = 1 << 2               # Magic/Ranged/Bomber/Ambush role
+_ANTI_HEAL = 1 << 3
+_ANTI_TANK = 1 << 4
+_GRANTS_IMMUNITY = 1 << 5
+_DISPEL = 1 << 6
+_PROVIDES_SHIELD = 1 << 7
+_HAS_CC = 1 << 8
+_BEAST = 1 << 9
+_TAUNT = 1 << 10            # In TAUNT_TANKS
+_BURST = 1 << 11            # Damage skill or in BURST_DAMAGE_COOKIES
+_SHADOW_MILK = 1 << 12
+_FRONT = 1 << 13
+_MIDDLE = 1 << 14
+_REAR = 1 << 15
+_POSITION_FLAGS = _FRONT | _MIDDLE | _REAR
+_HEALER_ROLE = 1 << 16      # Healing/Support role only
+_AMBUSH_OR_BACKLINE = 1 << 17
+
+# (flag, count key, name-list key) for the counted categories of an enemy analysis
+_COUNTED_FLAGS = (
+    (_HEALER, 'healers', 'healer_list'),
+    (_TANK, 'tanks', 'tank_list'),
+    (_DPS, 'dps_count', 'dps_list'),
+    (_HAS_CC, 'crowd_control', 'cc_list'),
+    (_ANTI_HEAL, 'anti_heal', 'anti_heal_list'),
+    (_ANTI_TANK, 'anti_tank', 'anti_tank_list'),
+    (_PROVIDES_SHIELD, 'shield_providers', 'shield_list'),
+    (_BEAST, 'beast_cookies', 'beast_list'),
+)
 
-HIGH_HP_TANKS = ['Millennial Tree Cookie', 'Hollyberry Cookie', 'Dark Cacao Cookie',
-                 'Elder Faerie Cookie']
+# Default analyze_enemy_team result in key order; None marks list slots that are
+# filled with a fresh list per analysis
+_ANALYSIS_TEMPLATE = {
+    'healers': 0,
+    'healer_list': None,
+    'tanks': 0,
+    'tank_list': None,
+    'dps_count': 0,
+    'dps_list': None,
+    'front_position': 0,
+    'middle_position': 0,
+    'rear_position': 0,
+    'crowd_control': 0,
+    'cc_list': None,
+    'cc_types': None,  # Types of CC (Stun, Freeze, Silence, etc.)
+    'beast_cookies': 0,
+    'beast_list': None,
+    'has_shadow_milk': False,
+    'anti_heal': 0,
+    'anti_heal_list': None,
+    'anti_tank': 0,
+    'anti_tank_list': None,
+    'immunity': False,
+    'immunity_types': None,  # Types of immunity granted
+    'cleanse': False,
+    'cleanse_list': None,
+    'taunt': False,
+    'burst_damage': False,
+    'shield_providers': 0,
+    'shield_list': None,
+}
+
+
+def _ability_mask(cookie: Cookie) -> int:
+    """
+    Get the ability flag mask for a cookie, computing it once per Cookie object.
+
+    Args:
+        cookie: Cookie to encode
+
+    Returns:
+        int: Bitwise OR of the module-level ability flags
+    """
+    mask = getattr(cookie, '_counter_mask', None)
+    if mask is not None:
+        return mask
+
+    mask = 0
+    if cookie.role in _HEALER_ROLES:
+        mask |= _HEALER | _HEALER_ROLE
+    elif cookie.provides_healing:
+        mask |= _HEALER
+    if cookie.role in _TANK_ROLES:
+        mask |= _TANK
+    if cookie.role in _DPS_ROLES:
+        mask |= _DPS
+    if cookie.anti_heal:
+        mask |= _ANTI_HEAL
+    if cookie.anti_tank:
+        mask |= _ANTI_TANK
+    if cookie.has_grants_immunity:
+        mask |= _GRANTS_IMMUNITY
+    if cookie.dispel:
+        mask |= _DISPEL
+    if cookie.provides_shield:
+        mask |= _PROVIDES_SHIELD
+    if cookie.has_cc:
+        mask |= _HAS_CC
+    if cookie.rarity == 'Beast':
+        mask |= _BEAST
+    if cookie.name in TAUNT_TANKS:
+        mask |= _TAUNT
+    if cookie.skill_type == 'Damage' or cookie.name in BURST_DAMAGE_COOKIES:
+        mask |= _BURST
+    if cookie.name == 'Shadow Milk Cookie':
+        mask |= _SHADOW_MILK
+    if cookie.position == 'Front':
+        mask |= _FRONT
+    elif cookie.position == 'Middle':
+        mask |= _MIDDLE
+    elif cookie.position == 'Rear':
+        mask |= _REAR
+    if cookie.role == 'Ambush' or cookie.target_type == 'Backline':
+        mask |= _AMBUSH_OR_BACKLINE
+
+    cookie._counter_mask = mask
+    return mask
+
+
+def _treasure_profile(treasure: Treasure) -> Tuple[float, frozenset]:
+    """
+    Get a treasure's tier base score and archetype set, computing them once per Treasure object.
+
+    Args:
+        treasure: Treasure to profile
+
+    Returns:
+        Tuple of (tier base score, frozenset of recommended archetypes)
+    """
+    profile = getattr(treasure, '_counter_profile', None)
+    if profile is None:
+        profile = (_TIER_BASE.get(treasure.tier_ranking, 2.0),
+                   frozenset(treasure.recommended_archetypes))
+        treasure._counter_profile = profile
+    return profile
+
+
+def _team_mask(team: Team) -> int:
+    """
+    Get the OR of a team's cookie ability masks, computing it once per Team object.
+
+    Args:
+        team: Team to encode
+
+    Returns:
+        int: Bitwise OR of _ability_mask over the team's cookies
+    """
+    mask = getattr(team, '_counter_team_mask', None)
+    if mask is None:
+        mask = 0
+        for cookie in team.cookies:
+            mask |= _ability_mask(cookie)
+        team._counter_team_mask = mask
+    return mask
+
+
+def _counter_bonus_rules(analysis: Dict) -> Tuple[Tuple[int, int], ...]:
+    """
+    Get the ability bonuses a counter team can earn against an analyzed enemy.
+
+    Args:
+        analysis: Result of CounterTeamGenerator.analyze_enemy_team
+
+    Returns:
+        Tuple of (ability flag, points) pairs, in scoring order
+    """
+    rules = []
+
+    # Anti-heal if enemy has healers (10 points) - use ability data
+    if analysis['healers'] >= 2:
+        rules.append((_ANTI_HEAL, 10))
+
+    # Ambush or backline targeting if enemy has exposed backline (10 points)
+    if analysis['rear_position'] >= 3:
+        rules.append((_AMBUSH_OR_BACKLINE, 10))
+
+    # Defense shred/anti-tank if enemy is tank-heavy (10 points) - use ability data
+    if analysis['tanks'] >= 2:
+        rules.append((_ANTI_TANK, 10))
+
+    # Crowd control if enemy lacks immunity (10 points) - use ability data
+    if not analysis['immunity']:
+        rules.append((_HAS_CC, 5))
+
+    # Immunity if enemy has CC (5 points) - use ability data
+    if analysis['crowd_control'] >= 2:
+        rules.append((_GRANTS_IMMUNITY, 5))
+
+    # Team balance (15 points max)
+    rules.append((_TANK, 5))
+    rules.append((_HEALER_ROLE, 5))
+    rules.append((_DPS, 5))
+
+    return tuple(rules)
+
+
+def _team_archetypes(team: Team) -> frozenset:
+    """
+    Get the treasure archetypes a team's roles cover, computing them once per Team object.
+
+    Args:
+        team: Team to classify
+
+    Returns:
+        frozenset: Subset of {'DPS', 'Tank', 'Sustain'}
+    """
+    archetypes = getattr(team, '_counter_archetypes', None)
+    if archetypes is None:
+        role_dist = team.get_role_distribution()
+        found = set()
+        if not _DPS_ROLES.isdisjoint(role_dist):
+            found.add('DPS')
+        if not _TANK_ROLES.isdisjoint(role_dist):
+            found.add('Tank')
+        if not _HEALER_ROLES.isdisjoint(role_dist):
+            found.add('Sustain')
+        archetypes = frozenset(found)
+        team._counter_archetypes = archetypes
+    return archetypes
+
+
+def _copy_analysis(analysis: Dict) -> Dict:
+    """
+    Copy an enemy analysis so callers cannot alter the cached one.
+
+    Args:
+        analysis: Cached result of CounterTeamGenerator._cached_analysis
+
+    Returns:
+        dict: Copy with fresh name lists
+    """
+    return {key: list(value) if type(value) is list else value for key, value in analysis.items()}
 
 
 class CounterTeamGenerator:
@@ -70,6 +328,65 @@ class CounterTeamGenerator:
         self.all_cookies = optimizer.all_cookies
         self.all_treasures = optimizer.all_treasures
 
+    @property
+    def all_cookies(self) -> List[Cookie]:
+        """Cookie pool used to build counter-teams."""
+        return self._all_cookies
+
+    @all_cookies.setter
+    def all_cookies(self, cookies: List[Cookie]) -> None:
+        self._all_cookies = cookies
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """
+        Rebuild the counter-cookie lists derived from all_cookies.
+
+        Called automatically when all_cookies is reassigned; call it manually
+        after mutating the cookie list in place or editing cookie attributes.
+
+        Also resets the per-Cookie ability masks (_counter_mask) of the pool so
+        they are recomputed on next use. Masks cached on Team objects
+        (_counter_team_mask, _counter_archetypes) and Treasure profiles
+        (_counter_profile) are not reset: build new Team objects after editing
+        cookies, and new Treasure objects after editing treasures.
+        """
+        cookies = self._all_cookies
+
+        # Ability masks are read from cookie attributes; drop them so edits are picked up
+        for c in cookies:
+            c._counter_mask = None
+
+        # Counter scores depend on the strategy, which depends on the cookie pool
+        self._score_cache: OrderedDict = OrderedDict()
+
+        # Enemy analyses keyed by the enemy's cookie names (in team order); names
+        # may map to different cookie data in a new pool
+        self._analysis_cache: Dict[Tuple[str, ...], Dict] = {}
+
+        # First cookie with each name, matching a linear scan of the pool
+        self._cookie_by_name: Dict[str, Cookie] = {}
+        for c in cookies:
+            self._cookie_by_name.setdefault(c.name, c)
+
+        self._burst_damage_cookies = tuple(
+            c.name for c in cookies
+            if c.skill_type == 'Damage' and c.rarity in _HIGH_TIER_RARITIES
+        )
+        self._anti_heal_cookies = tuple(c.name for c in cookies if c.anti_heal)
+        self._defense_shred_cookies = tuple(c.name for c in cookies if c.anti_tank)
+        self._ambush_cookies = tuple(c.name for c in cookies if c.role == 'Ambush' or c.target_type == 'Backline')
+        self._immunity_cookies = tuple(
+            c.name for c in cookies if c.has_grants_immunity
+        )
+        self._cc_cookies = tuple(c.name for c in cookies if c.has_cc)
+        self._shield_cookies = tuple(c.name for c in cookies if c.provides_shield)
+        self._healing_cookies = tuple(c.name for c in cookies if c.provides_healing)
+        self._debuff_cookies = tuple(
+            c.name for c in cookies
+            if 'Debuff' in str(c.key_mechanic) or 'DoT' in str(c.key_mechanic)
+        )
+
     def analyze_enemy_team(self, enemy_team: Team) -> Dict:
         """
         Analyze enemy team composition to identify characteristics using ability data.
@@ -78,125 +395,129 @@ class CounterTeamGenerator:
             enemy_team: Enemy Team instance to analyze
 
         Returns:
-            dict: Analysis results with team characteristics
+            dict: Analysis results with team characteristics (a fresh copy the
+                caller may modify)
         """
-        analysis = {
-            'healers': 0,
-            'healer_list': [],
-            'tanks': 0,
-            'tank_list': [],
-            'dps_count': 0,
-            'dps_list': [],
-            'front_position': 0,
-            'middle_position': 0,
-            'rear_position': 0,
-            'crowd_control': 0,
-            'cc_list': [],
-            'cc_types': [],  # Types of CC (Stun, Freeze, Silence, etc.)
-            'beast_cookies': 0,
-            'beast_list': [],
-            'has_shadow_milk': False,
-            'anti_heal': 0,
-            'anti_heal_list': [],
-            'anti_tank': 0,
-            'anti_tank_list': [],
-            'immunity': False,
-            'immunity_types': [],  # Types of immunity granted
-            'cleanse': False,
-            'cleanse_list': [],
-            'taunt': False,
-            'burst_damage': False,
-            'shield_providers': 0,
-            'shield_list': []
-        }
+        return _copy_analysis(self._cached_analysis(enemy_team))
+
+    def _cached_analysis(self, enemy_team: Team) -> Dict:
+        """
+        Get the shared, cached analysis of an enemy lineup (internal callers only read it).
 
-        for cookie in enemy_team.cookies:
-            # Count healers - use both role AND ability data
-            if cookie.role in ['Healing', 'Support'] or cookie.provides_healing:
-                analysis['healers'] += 1
-                analysis['healer_list'].append(cookie.name)
-
-            # Count tanks
-            if cookie.role in ['Defense', 'Charge']:
-                analysis['tanks'] += 1
-                analysis['tank_list'].append(cookie.name)
-
-            # Count DPS
-            if cookie.role in ['Magic', 'Ranged', 'Bomber', 'Ambush']:
-                analysis['dps_count'] += 1
-                analysis['dps_list'].append(cookie.name)
-
-            # Count positions
-            if cookie.position == 'Front':
-                analysis['front_position'] += 1
-            elif cookie.position == 'Middle':
-                analysis['middle_position'] += 1
-            elif cookie.position == 'Rear':
-                analysis['rear_position'] += 1
-
-            # Crowd control detection - use ability data
-            if cookie.crowd_control and cookie.crowd_control != 'None':
-                analysis['crowd_control'] += 1
-                analysis['cc_list'].append(cookie.name)
-                if cookie.crowd_control not in analysis['cc_types']:
-                    analysis['cc_types'].append(cookie.crowd_control)
-
-            # Anti-heal detection - use ability data
-            if cookie.anti_heal:
-                analysis['anti_heal'] += 1
-                analysis['anti_heal_list'].append(cookie.name)
-
-            # Anti-tank detection - use ability data
-            if cookie.anti_tank:
-                analysis['anti_tank'] += 1
-                analysis['anti_tank_list'].append(cookie.name)
-
-            # Immunity detection - use ability data
-            if cookie.grants_immunity and cookie.grants_immunity != 'None':
-                analysis['immunity'] = True
-                if cookie.grants_immunity not in analysis['immunity_types']:
-                    analysis['immunity_types'].append(cookie.grants_immunity)
-
-            # Dispel/cleanse detection - use ability data
-            if cookie.dispel:
-                analysis['cleanse'] = True
-                analysis['cleanse_list'].append(cookie.name)
-
-            # Shield providers - use ability data
-            if cookie.provides_shield:
-                analysis['shield_providers'] += 1
-                analysis['shield_list'].append(cookie.name)
-
-            # Special cookie detection
-            if cookie.rarity == 'Beast':
-                analysis['beast_cookies'] += 1
-                analysis['beast_list'].append(cookie.name)
-
-            if cookie.name == 'Shadow Milk Cookie':
-                analysis['has_shadow_milk'] = True
-
-            # Taunt detection (still using hardcoded list as this is position-based mechanic)
-            if cookie.name in TAUNT_TANKS:
-                analysis['taunt'] = True
-
-            # Burst damage detection (skill type or hardcoded list)
-            if cookie.skill_type == 'Damage' or cookie.name in BURST_DAMAGE_COOKIES:
-                analysis['burst_damage'] = True
+        Args:
+            enemy_team: Enemy Team instance to analyze
+
+        Returns:
+            dict: Cached analysis results; must not be modified
+        """
+        key = tuple(cookie.name for cookie in enemy_team.cookies)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # One flag mask per cookie; OR-ing them answers the team-wide yes/no questions
+        masked = [(cookie, _ability_mask(cookie)) for cookie in enemy_team.cookies]
+        combined = 0
+        for _, mask in masked:
+            combined |= mask
+
+        # C-level copy of the scalar defaults; each list slot is filled exactly once below
+        analysis = dict(_ANALYSIS_TEMPLATE)
+
+        # Counted categories with their cookie name lists
+        for flag, count_key, list_key in _COUNTED_FLAGS:
+            if combined & flag:
+                names = [cookie.name for cookie, mask in masked if mask & flag]
+                analysis[count_key] = len(names)
+                analysis[list_key] = names
+            else:
+                analysis[list_key] = []
+
+        # Count positions
+        if combined & _POSITION_FLAGS:
+            front = middle = rear = 0
+            for _, mask in masked:
+                if mask & _FRONT:
+                    front += 1
+                elif mask & _MIDDLE:
+                    middle += 1
+                elif mask & _REAR:
+                    rear += 1
+            analysis['front_position'] = front
+            analysis['middle_position'] = middle
+            analysis['rear_position'] = rear
+
+        # CC types, in order of first appearance
+        if combined & _HAS_CC:
+            analysis['cc_types'] = list(dict.fromkeys(
+                cookie.crowd_control for cookie, mask in masked if mask & _HAS_CC
+            ))
+        else:
+            analysis['cc_types'] = []
+
+        # Immunity detection - use ability data
+        if combined & _GRANTS_IMMUNITY:
+            analysis['immunity'] = True
+            analysis['immunity_types'] = list(dict.fromkeys(
+                cookie.grants_immunity for cookie, mask in masked if mask & _GRANTS_IMMUNITY
+            ))
+        else:
+            analysis['immunity_types'] = []
+
+        # Dispel/cleanse detection - use ability data
+        if combined & _DISPEL:
+            analysis['cleanse'] = True
+            analysis['cleanse_list'] = [cookie.name for cookie, mask in masked if mask & _DISPEL]
+        else:
+            analysis['cleanse_list'] = []
+
+        analysis['has_shadow_milk'] = bool(combined & _SHADOW_MILK)
+        analysis['taunt'] = bool(combined & _TAUNT)
+        analysis['burst_damage'] = bool(combined & _BURST)
+
+        if len(self._analysis_cache) >= _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.clear()
+        self._analysis_cache[key] = analysis
 
         return analysis
 
-    def identify_weaknesses(self, enemy_team: Team) -> List[Dict]:
+    def analyze_enemy_teams_batch(self, enemy_teams: List[Team]) -> List[Dict]:
+        """
+        Analyze many enemy teams, e.g. when sweeping a roster against the meta.
+
+        Repeated lineups in the batch are analyzed once. Each result is its own
+        copy, equal to what analyze_enemy_team would return.
+
+        Args:
+            enemy_teams: Enemy Team instances to analyze
+
+        Returns:
+            List of analysis dicts, in the same order as enemy_teams
+        """
+        by_lineup: Dict[Tuple[str, ...], Dict] = {}
+        results = []
+        for enemy_team in enemy_teams:
+            key = tuple(cookie.name for cookie in enemy_team.cookies)
+            analysis = by_lineup.get(key)
+            if analysis is None:
+                analysis = by_lineup[key] = self._cached_analysis(enemy_team)
+            results.append(_copy_analysis(analysis))
+        return results
+
+    def identify_weaknesses(self, enemy_team: Team, analysis: Optional[Dict] = None) -> List[Dict]:
         """
         Identify exploitable weaknesses in enemy team.
 
         Args:
             enemy_team: Enemy Team to analyze
+            analysis: Optional precomputed result of analyze_enemy_team(enemy_team)
 
         Returns:
             List of weakness dicts with exploit strategies
         """
         weaknesses = []
-        analysis = self.analyze_enemy_team(enemy_team)
+        if analysis is None:
+            analysis = self._cached_analysis(enemy_team)
 
         # Weakness 1: No healing/sustain
         if analysis['healers'] == 0:
@@ -290,18 +611,19 @@ class CounterTeamGenerator:
 
         return weaknesses
 
-    def generate_counter_strategies(self, enemy_team: Team) -> Dict:
+    def generate_counter_strategies(self, enemy_team: Team, analysis: Optional[Dict] = None) -> Dict:
         """
         Generate comprehensive counter strategies based on enemy composition using ability data.
 
         Args:
             enemy_team: Enemy Team to counter
+            analysis: Optional precomputed result of analyze_enemy_team(enemy_team)
 
         Returns:
             dict: Counter strategies with cookie suggestions
         """
-        analysis = self.analyze_enemy_team(enemy_team)
-        weaknesses = self.identify_weaknesses(enemy_team)
+        if analysis is None:
+            analysis = self._cached_analysis(enemy_team)
 
         counter_strategy = {
             'recommended_cookies': [],
@@ -344,15 +666,15 @@ class CounterTeamGenerator:
 
         # ===== END META DATABASE INTEGRATION =====
 
-        # Build dynamic counter cookie lists using ability data
-        burst_damage_cookies = [c.name for c in self.all_cookies if c.skill_type == 'Damage' and c.rarity in ['Beast', 'Ancient', 'Legendary']]
-        anti_heal_cookies = [c.name for c in self.all_cookies if c.anti_heal]
-        defense_shred_cookies = [c.name for c in self.all_cookies if c.anti_tank]
-        ambush_cookies = [c.name for c in self.all_cookies if c.role == 'Ambush' or c.target_type == 'Backline']
-        immunity_cookies = [c.name for c in self.all_cookies if c.grants_immunity and c.grants_immunity != 'None']
-        cc_cookies = [c.name for c in self.all_cookies if c.crowd_control and c.crowd_control != 'None']
-        shield_cookies = [c.name for c in self.all_cookies if c.provides_shield]
-        healing_cookies = [c.name for c in self.all_cookies if c.provides_healing]
+        # Dynamic counter cookie lists (built from ability data in invalidate_cache)
+        burst_damage_cookies = self._burst_damage_cookies
+        anti_heal_cookies = self._anti_heal_cookies
+        defense_shred_cookies = self._defense_shred_cookies
+        ambush_cookies = self._ambush_cookies
+        immunity_cookies = self._immunity_cookies
+        cc_cookies = self._cc_cookies
+        shield_cookies = self._shield_cookies
+        healing_cookies = self._healing_cookies
 
         # Strategy 1: Counter no healing
         if analysis['healers'] == 0:
@@ -366,7 +688,7 @@ class CounterTeamGenerator:
         elif analysis['healers'] >= 2:
             counter_strategy['recommended_cookies'].extend(anti_heal_cookies)
             counter_strategy['recommended_cookies'].extend(ambush_cookies[:3])
-            counter_strategy['priority_targets'] = analysis['healer_list']
+            counter_strategy['priority_targets'] = list(analysis['healer_list'])
             counter_strategy['strategy_description'] = 'Eliminate healers with ambush cookies and use anti-heal'
             counter_strategy['team_archetype'] = 'Anti-Heal Assassin'
             counter_strategy['confidence'] = 88
@@ -388,7 +710,7 @@ class CounterTeamGenerator:
 
         # Strategy 5: Counter Shadow Milk
         if analysis['has_shadow_milk']:
-            counter_strategy['recommended_cookies'].extend(TAUNT_TANKS)
+            counter_strategy['recommended_cookies'].extend(_TAUNT_TANKS_ORDERED)
             counter_strategy['recommended_cookies'].append('Shadow Milk Cookie')  # Mirror match
             counter_strategy['recommended_cookies'].append('Black Pearl Cookie')  # Burst before lockdown
             counter_strategy['avoid_cookies'].append('Single-carry DPS teams')
@@ -407,7 +729,7 @@ class CounterTeamGenerator:
         if analysis['burst_damage'] and analysis['healers'] <= 1:
             counter_strategy['recommended_cookies'].extend(shield_cookies[:3])
             counter_strategy['recommended_cookies'].extend(healing_cookies[:2])
-            counter_strategy['recommended_cookies'].extend(HIGH_HP_TANKS[:2])
+            counter_strategy['recommended_cookies'].extend(_HIGH_HP_TANKS_ORDERED[:2])
             counter_strategy['strategy_description'] = 'High HP tanks, shields, and healing to survive burst, then attrition'
             counter_strategy['team_archetype'] = 'Tank/Sustain'
             counter_strategy['confidence'] = 85
@@ -421,18 +743,24 @@ class CounterTeamGenerator:
 
         # Strategy 9: Counter no cleanse - recommend debuff stacking
         if not analysis['cleanse']:
-            debuff_cookies = [c.name for c in self.all_cookies if 'Debuff' in str(c.key_mechanic) or 'DoT' in str(c.key_mechanic)]
+            debuff_cookies = self._debuff_cookies
             if debuff_cookies:
                 counter_strategy['recommended_cookies'].extend(debuff_cookies[:3])
                 counter_strategy['strategy_description'] = 'Stack debuffs and damage-over-time effects'
 
-        # Remove duplicates
-        counter_strategy['recommended_cookies'] = list(set(counter_strategy['recommended_cookies']))
-        counter_strategy['avoid_cookies'] = list(set(counter_strategy['avoid_cookies']))
+        # Remove duplicates, keeping first-seen order so earlier (meta/high-threat) picks stay first
+        counter_strategy['recommended_cookies'] = list(dict.fromkeys(counter_strategy['recommended_cookies']))
+        counter_strategy['avoid_cookies'] = list(dict.fromkeys(counter_strategy['avoid_cookies']))
 
         return counter_strategy
 
-    def recommend_counter_treasures(self, enemy_team: Team, counter_team: Team, strategy: Dict) -> List[Tuple]:
+    def recommend_counter_treasures(
+        self,
+        enemy_team: Team,
+        counter_team: Team,
+        strategy: Dict,
+        analysis: Optional[Dict] = None
+    ) -> List[Tuple]:
         """
         Recommend treasures specifically for countering enemy team.
 
@@ -440,14 +768,13 @@ class CounterTeamGenerator:
             enemy_team: Enemy team to counter
             counter_team: Your counter team
             strategy: Counter strategy dict from generate_counter_strategies
+            analysis: Optional precomputed result of analyze_enemy_team(enemy_team)
 
         Returns:
             List of (Treasure, score, reason) tuples
         """
-        from team_optimizer import Treasure
-
-        analysis = self.analyze_enemy_team(enemy_team)
-        treasure_scores = []
+        if analysis is None:
+            analysis = self._cached_analysis(enemy_team)
 
         # ===== META DATABASE TREASURE INTEGRATION =====
         # Get treasure recommendations from meta database
@@ -461,13 +788,59 @@ class CounterTeamGenerator:
             meta_treasure_boost[treasure_name] = 5.0  # Significant boost for meta recommendations
         # ===== END META DATABASE TREASURE INTEGRATION =====
 
-        for treasure in self.all_treasures:
+        # Counter team archetypes depend only on the team, not the treasure
+        team_archetypes = _team_archetypes(counter_team)
+
+        # Matchup conditions are the same for every treasure
+        healing_heavy = analysis['healers'] >= 2
+        tank_heavy = analysis['tanks'] >= 2
+        exposed_backline = analysis['rear_position'] >= 3 and analysis['front_position'] <= 1
+        has_shadow_milk = analysis['has_shadow_milk']
+        cc_heavy = analysis['crowd_control'] >= 2
+        burst_damage = analysis['burst_damage']
+        no_immunity = not analysis['immunity']
+        no_cleanse = not analysis['cleanse']
+        cc_sustain_reason = f"Sustain to survive {', '.join(analysis['cc_types'])} CC"
+
+        # Upper bound on the strategy/archetype bonus any treasure can earn in this matchup,
+        # used to skip treasures that cannot reach the current top 3
+        max_bonus = 3.0 + len(team_archetypes) * 1.5  # Universal + archetype matches
+        if healing_heavy:
+            max_bonus += 7.0
+        if tank_heavy:
+            max_bonus += 6.0
+        if exposed_backline:
+            max_bonus += 8.0
+        if has_shadow_milk:
+            max_bonus += 10.0
+        if cc_heavy:
+            max_bonus += 9.0
+        if burst_damage:
+            max_bonus += 16.0
+        if no_immunity:
+            max_bonus += 6.0
+        if no_cleanse:
+            max_bonus += 3.0
+
+        # Min-heap of the best 3 as (score, -index, treasure, reason); -index keeps the
+        # earlier treasure on ties, matching a stable descending sort
+        top = []
+
+        for index, treasure in enumerate(self.all_treasures):
+            # Base tier score
+            tier_base, archetypes = _treasure_profile(treasure)
+            base = tier_base
+            if treasure.name in meta_treasure_boost:
+                base += meta_treasure_boost[treasure.name]
+
+            # Later treasures lose ties, so an equal upper bound cannot enter the top 3
+            if len(top) == 3 and base + max_bonus <= top[0][0]:
+                continue
+
             score = 0.0
             reasons = []
 
-            # Base tier score
-            tier_base = {'S+': 10.0, 'S': 8.0, 'A': 6.0, 'B': 4.0, 'C': 2.0}
-            score += tier_base.get(treasure.tier_ranking, 2.0)
+            score += tier_base
 
             # Add meta database boost if this treasure is recommended
             if treasure.name in meta_treasure_boost:
@@ -477,7 +850,7 @@ class CounterTeamGenerator:
             # Strategy-based treasure recommendations
 
             # 1. Counter healing-heavy teams with anti-heal or burst damage
-            if analysis['healers'] >= 2:
+            if healing_heavy:
                 if treasure.atk_boost_max > 0 or treasure.crit_boost_max > 0:
                     score += 4.0
                     reasons.append("Burst damage to overwhelm healing")
@@ -486,7 +859,7 @@ class CounterTeamGenerator:
                     reasons.append("Debuffs to reduce enemy effectiveness")
 
             # 2. Counter tank-heavy teams with sustained damage and CDR
-            if analysis['tanks'] >= 2:
+            if tank_heavy:
                 if treasure.cooldown_reduction_max > 0:
                     score += 4.0
                     reasons.append("CDR for sustained pressure vs tanks")
@@ -495,7 +868,7 @@ class CounterTeamGenerator:
                     reasons.append("ATK boost for tank-busting")
 
             # 3. Counter exposed backline with offensive treasures
-            if analysis['rear_position'] >= 3 and analysis['front_position'] <= 1:
+            if exposed_backline:
                 if treasure.atk_boost_max > 0 or treasure.crit_boost_max > 0:
                     score += 5.0
                     reasons.append("Offensive stats to punish weak frontline")
@@ -504,7 +877,7 @@ class CounterTeamGenerator:
                     reasons.append("Faster skills to burst backline")
 
             # 4. Counter Shadow Milk with defensive treasures
-            if analysis['has_shadow_milk']:
+            if has_shadow_milk:
                 if treasure.hp_shield_max > 0:
                     score += 4.0
                     reasons.append("Shield to survive Shadow Milk burst")
@@ -516,16 +889,16 @@ class CounterTeamGenerator:
                     reasons.append("Cleanse Shadow Milk debuffs")
 
             # 5. Counter CC-heavy teams with sustain
-            if analysis['crowd_control'] >= 2:
+            if cc_heavy:
                 if treasure.hp_shield_max > 0 or treasure.heal_max > 0:
                     score += 4.0
-                    reasons.append(f"Sustain to survive {', '.join(analysis['cc_types'])} CC")
+                    reasons.append(cc_sustain_reason)
                 if treasure.debuff_cleanse:
                     score += 5.0
                     reasons.append("Cleanse crowd control effects")
 
             # 6. Counter burst damage teams with defense
-            if analysis['burst_damage']:
+            if burst_damage:
                 if treasure.hp_shield_max > 0:
                     score += 5.0
                     reasons.append("Shield critical vs burst damage")
@@ -540,7 +913,7 @@ class CounterTeamGenerator:
                     reasons.append("Revival as backup vs burst")
 
             # 7. Exploit no immunity with offensive treasures
-            if not analysis['immunity']:
+            if no_immunity:
                 if treasure.enemy_debuff:
                     score += 4.0
                     reasons.append("Debuffs (enemy has no immunity)")
@@ -549,38 +922,33 @@ class CounterTeamGenerator:
                     reasons.append("CDR to spam CC")
 
             # 8. Exploit no cleanse with debuff treasures
-            if not analysis['cleanse']:
+            if no_cleanse:
                 if treasure.enemy_debuff:
                     score += 3.0
                     reasons.append("Enemy can't cleanse debuffs")
 
             # Universal treasures always score well
-            if 'Universal' in treasure.recommended_archetypes:
+            if 'Universal' in archetypes:
                 score += 3.0
                 if not reasons:
                     reasons.append("Universal treasure (works with any strategy)")
 
             # Archetype matching bonus
-            team_archetypes = set()
-            counter_role_dist = counter_team.get_role_distribution()
-            if any(role in counter_role_dist for role in ['Magic', 'Ranged', 'Bomber', 'Ambush']):
-                team_archetypes.add('DPS')
-            if any(role in counter_role_dist for role in ['Defense', 'Charge']):
-                team_archetypes.add('Tank')
-            if any(role in counter_role_dist for role in ['Healing', 'Support']):
-                team_archetypes.add('Sustain')
-
-            matching_archetypes = set(treasure.recommended_archetypes) & team_archetypes
+            matching_archetypes = team_archetypes & archetypes
             if matching_archetypes:
                 score += len(matching_archetypes) * 1.5
 
             # Compile final recommendation
             reason = reasons[0] if reasons else "Standard treasure"
-            treasure_scores.append((treasure, score, reason))
+            entry = (score, -index, treasure, reason)
+            if len(top) < 3:
+                heapq.heappush(top, entry)
+            elif entry[:2] > top[0][:2]:
+                heapq.heapreplace(top, entry)
 
-        # Sort by score and return top 3
-        treasure_scores.sort(key=lambda x: x[1], reverse=True)
-        return treasure_scores[:3]
+        # Highest score first
+        top.sort(key=lambda x: x[:2], reverse=True)
+        return [(treasure, score, reason) for score, _, treasure, reason in top]
 
     def find_counter_teams(
         self,
@@ -601,47 +969,60 @@ class CounterTeamGenerator:
         Returns:
             List of (Team, counter_info) tuples with counter analysis
         """
-        # Get counter strategy
-        counter_strategy = self.generate_counter_strategies(enemy_team)
-        weaknesses = self.identify_weaknesses(enemy_team)
+        # Get counter strategy (the enemy analysis is computed once and shared below)
+        analysis = self._cached_analysis(enemy_team)
+        counter_strategy = self.generate_counter_strategies(enemy_team, analysis=analysis)
+        weaknesses = self.identify_weaknesses(enemy_team, analysis=analysis)
 
         # Filter cookies to prioritize counter picks
-        recommended_names = counter_strategy['recommended_cookies']
+        recommended_names = frozenset(counter_strategy['recommended_cookies'])
         counter_cookies = [c for c in self.all_cookies if c.name in recommended_names]
 
         # If we don't have enough counter cookies, add high-tier cookies
         if len(counter_cookies) < 20:
+            counter_names = {c.name for c in counter_cookies}
             high_tier = [c for c in self.all_cookies
-                        if c.rarity in ['Beast', 'Ancient', 'Legendary']
-                        and c not in counter_cookies]
+                        if c.rarity in _HIGH_TIER_RARITIES
+                        and c.name not in counter_names]
             counter_cookies.extend(high_tier[:20 - len(counter_cookies)])
 
         # Generate teams using counter cookies
         if method == 'greedy':
             # Greedy approach: start with best counter cookies
             teams = []
+            seen_signatures = set()
             for _ in range(n * 3):  # Generate more than needed
                 team_cookies = []
+                # Cookie equality is by name, so track names for O(1) membership checks
+                team_names = set()
 
                 # Add required cookies first
                 if required_cookies:
                     for name in required_cookies:
-                        cookie = next((c for c in self.all_cookies if c.name == name), None)
+                        cookie = self._cookie_by_name.get(name)
                         if cookie:
                             team_cookies.append(cookie)
+                            team_names.add(cookie.name)
 
                 # Fill remaining slots with counter cookies
-                available = [c for c in counter_cookies if c not in team_cookies]
+                available = [c for c in counter_cookies if c.name not in team_names]
                 while len(team_cookies) < 5 and available:
-                    team_cookies.append(available.pop(0))
+                    cookie = available.pop(0)
+                    team_cookies.append(cookie)
+                    team_names.add(cookie.name)
 
                 # If still not enough, add any high-tier cookies
                 if len(team_cookies) < 5:
-                    remaining = [c for c in self.all_cookies if c not in team_cookies]
+                    remaining = [c for c in self.all_cookies if c.name not in team_names]
                     remaining.sort(key=lambda c: self.optimizer.rarity_weights.get(c.rarity, 0), reverse=True)
                     team_cookies.extend(remaining[:5 - len(team_cookies)])
 
                 if len(team_cookies) == 5:
+                    # The greedy fill is deterministic, so a repeated lineup means no new teams
+                    signature = frozenset(c.name for c in team_cookies)
+                    if signature in seen_signatures:
+                        break
+                    seen_signatures.add(signature)
                     teams.append(Team(team_cookies))
 
         else:
@@ -657,13 +1038,38 @@ class CounterTeamGenerator:
 
             self.optimizer.all_cookies = original_cookies
 
-        # Score teams based on counter effectiveness
+        # Score teams based on counter effectiveness; the enemy-dependent bonus
+        # rules are the same for every candidate
+        enemy_key = tuple(c.name for c in enemy_team.cookies)
+        bonus_rules = _counter_bonus_rules(analysis)
+        scored_signatures = set()
         scored_teams = []
         for team in teams:
-            counter_score = self._calculate_counter_score(team, enemy_team, counter_strategy)
-
-            # Get treasure recommendations for this counter team
-            recommended_treasures = self.recommend_counter_treasures(enemy_team, team, counter_strategy)
+            signature = team.get_cookie_signature()
+            if signature in scored_signatures:
+                continue
+            scored_signatures.add(signature)
+
+            cache_key = (signature, enemy_key)
+            cached = self._score_cache.get(cache_key)
+            if cached is not None:
+                self._score_cache.move_to_end(cache_key)
+                counter_score, recommended_treasures = cached
+            else:
+                counter_score = self._calculate_counter_score(
+                    team, enemy_team, counter_strategy,
+                    analysis=analysis, recommended_names=recommended_names,
+                    bonus_rules=bonus_rules
+                )
+
+                # Get treasure recommendations for this counter team
+                recommended_treasures = self.recommend_counter_treasures(
+                    enemy_team, team, counter_strategy, analysis=analysis
+                )
+
+                self._score_cache[cache_key] = (counter_score, recommended_treasures)
+                if len(self._score_cache) > _SCORE_CACHE_SIZE:
+                    self._score_cache.popitem(last=False)
 
             counter_info = {
                 'counter_score': counter_score,
@@ -692,16 +1098,17 @@ class CounterTeamGenerator:
             }
             scored_teams.append((team, counter_info))
 
-        # Sort by combined score
-        scored_teams.sort(key=lambda x: x[1]['combined_score'], reverse=True)
-
-        return scored_teams[:n]
+        # Top n by combined score (ties keep generation order, like a stable sort)
+        return heapq.nlargest(n, scored_teams, key=lambda x: x[1]['combined_score'])
 
     def _calculate_counter_score(
         self,
         counter_team: Team,
         enemy_team: Team,
-        strategy: Dict
+        strategy: Dict,
+        analysis: Optional[Dict] = None,
+        recommended_names: Optional[frozenset] = None,
+        bonus_rules: Optional[Tuple[Tuple[int, int], ...]] = None
     ) -> float:
         """
         Calculate how well a team counters the enemy using ability data (0-100 score).
@@ -710,6 +1117,9 @@ class CounterTeamGenerator:
             counter_team: Your counter team
             enemy_team: Enemy team to counter
             strategy: Counter strategy dict
+            analysis: Optional precomputed result of analyze_enemy_team(enemy_team)
+            recommended_names: Optional precomputed set of strategy['recommended_cookies']
+            bonus_rules: Optional precomputed result of _counter_bonus_rules(analysis)
 
         Returns:
             float: Counter effectiveness score (0-100)
@@ -718,66 +1128,31 @@ class CounterTeamGenerator:
         max_score = 100.0
 
         # Check for recommended counter cookies (40 points max)
-        recommended_count = sum(
-            1 for cookie in counter_team.cookies
-            if cookie.name in strategy['recommended_cookies']
-        )
+        if recommended_names is None:
+            recommended_names = frozenset(strategy['recommended_cookies'])
+        # Team cookies are unique, so the overlap size is the recommended count
+        recommended_count = len(recommended_names.intersection(
+            [cookie.name for cookie in counter_team.cookies]
+        ))
         score += (recommended_count / 5) * 40
 
         # Check if team has essential counter elements using ability data (30 points max)
-        analysis = self.analyze_enemy_team(enemy_team)
+        if analysis is None:
+            analysis = self._cached_analysis(enemy_team)
 
-        # Anti-heal if enemy has healers (10 points) - use ability data
-        if analysis['healers'] >= 2:
-            has_anti_heal = any(c.anti_heal for c in counter_team.cookies)
-            if has_anti_heal:
-                score += 10
-
-        # Ambush or backline targeting if enemy has exposed backline (10 points)
-        if analysis['rear_position'] >= 3:
-            has_ambush = any(c.role == 'Ambush' or c.target_type == 'Backline' for c in counter_team.cookies)
-            if has_ambush:
-                score += 10
-
-        # Defense shred/anti-tank if enemy is tank-heavy (10 points) - use ability data
-        if analysis['tanks'] >= 2:
-            has_def_shred = any(c.anti_tank for c in counter_team.cookies)
-            if has_def_shred:
-                score += 10
-
-        # Crowd control if enemy lacks immunity (10 points) - use ability data
-        if not analysis['immunity']:
-            has_cc = any(c.crowd_control and c.crowd_control != 'None' for c in counter_team.cookies)
-            if has_cc:
-                score += 5
+        # All counter-team ability checks below read one OR-ed flag mask
+        team_mask = _team_mask(counter_team)
 
-        # Immunity if enemy has CC (5 points) - use ability data
-        if analysis['crowd_control'] >= 2:
-            has_immunity = any(c.grants_immunity and c.grants_immunity != 'None' for c in counter_team.cookies)
-            if has_immunity:
-                score += 5
-
-        # Team balance (15 points max)
-        role_dist = counter_team.get_role_distribution()
-        has_tank = any(role in role_dist for role in ['Defense', 'Charge'])
-        has_healer = any(role in role_dist for role in ['Healing', 'Support'])
-        has_dps = any(role in role_dist for role in ['Magic', 'Ranged', 'Bomber', 'Ambush'])
-
-        if has_tank:
-            score += 5
-        if has_healer:
-            score += 5
-        if has_dps:
-            score += 5
-
-        # Synergy bonus (15 points max)
-        # Use new total_synergy_score if available, otherwise fall back to legacy synergy_score
-        if hasattr(counter_team, 'total_synergy_score'):
-            # New advanced synergy system (0-60 scale)
-            score += (counter_team.total_synergy_score / 60) * 15
-        elif hasattr(counter_team, 'synergy_score'):
-            # Legacy synergy system (0-100 scale)
-            score += (counter_team.synergy_score / 100) * 15
+        # Matchup counters and team balance, as (flag, points) rules for this enemy
+        if bonus_rules is None:
+            bonus_rules = _counter_bonus_rules(analysis)
+        for flag, points in bonus_rules:
+            if team_mask & flag:
+                score += points
+
+        # Synergy bonus (15 points max) from the advanced synergy system (0-60 scale);
+        # every Team defines it, and a hasattr probe would evaluate the property twice
+        score += (counter_team.total_synergy_score / 60) * 15
 
         return min(score, max_score)
 
@@ -792,42 +1167,49 @@ class CounterTeamGenerator:
         Returns:
             str: Detailed explanation
         """
-        weaknesses = self.identify_weaknesses(enemy_team)
-        strategy = self.generate_counter_strategies(enemy_team)
+        # One enemy analysis feeds both the weaknesses and the strategy
+        analysis = self._cached_analysis(enemy_team)
+        weaknesses = self.identify_weaknesses(enemy_team, analysis=analysis)
+        strategy = self.generate_counter_strategies(enemy_team, analysis=analysis)
 
-        explanation = f"Counter-Team Analysis\n"
-        explanation += f"{'='*60}\n\n"
+        # Collect the pieces and join once instead of re-copying a growing string
+        parts = [f"Counter-Team Analysis\n{_SEP60}\n\n"]
 
         # Enemy weaknesses
-        explanation += f"Enemy Weaknesses Identified ({len(weaknesses)}):\n"
+        parts.append(f"Enemy Weaknesses Identified ({len(weaknesses)}):\n")
         for i, weakness in enumerate(weaknesses, 1):
-            explanation += f"{i}. {weakness['weakness']} ({weakness['priority']} priority)\n"
-            explanation += f"   → {weakness['description']}\n"
-            explanation += f"   → Exploit: {weakness['exploit']}\n\n"
+            parts.append(
+                f"{i}. {weakness['weakness']} ({weakness['priority']} priority)\n"
+                f"   → {weakness['description']}\n"
+                f"   → Exploit: {weakness['exploit']}\n\n"
+            )
 
         # Counter strategy
-        explanation += f"Counter Strategy: {strategy['team_archetype']}\n"
-        explanation += f"{strategy['strategy_description']}\n\n"
+        parts.append(
+            f"Counter Strategy: {strategy['team_archetype']}\n"
+            f"{strategy['strategy_description']}\n\n"
+        )
 
         # Recommended cookies in team
+        recommended_names = set(strategy['recommended_cookies'])
         counter_cookies_used = [
             c.name for c in counter_team.cookies
-            if c.name in strategy['recommended_cookies']
+            if c.name in recommended_names
         ]
 
         if counter_cookies_used:
-            explanation += f"Counter Cookies Used:\n"
+            parts.append("Counter Cookies Used:\n")
             for cookie_name in counter_cookies_used:
-                explanation += f"  ✓ {cookie_name}\n"
-            explanation += "\n"
+                parts.append(f"  ✓ {cookie_name}\n")
+            parts.append("\n")
 
         # Priority targets
         if strategy['priority_targets']:
-            explanation += f"Priority Targets to Eliminate:\n"
+            parts.append("Priority Targets to Eliminate:\n")
             for target in strategy['priority_targets']:
-                explanation += f"  🎯 {target}\n"
+                parts.append(f"  🎯 {target}\n")
 
-        return explanation
+        return "".join(parts)
 
 
 def main():
@@ -848,9 +1230,9 @@ def main():
     if len(enemy_cookies) >= 5:
         enemy_team = Team(enemy_cookies)
 
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP60}")
         print(f"Enemy Team: {', '.join([c.name for c in enemy_team.cookies])}")
-        print(f"{'='*60}\n")
+        print(f"{_SEP60}\n")
 
         # Generate counter-teams
         generator = CounterTeamGenerator(optimizer)
@@ -864,9 +1246,9 @@ def main():
             print(f"    Exploit: {weakness['exploit']}\n")
 
         # Generate counter-teams
-        print(f"\n{'='*60}")
+        print(f"\n{_SEP60}")
         print("Top 3 Counter-Teams:")
-        print(f"{'='*60}\n")
+        print(f"{_SEP60}\n")
 
         counter_teams = generator.find_counter_teams(enemy_team, n=3, method='greedy')
 
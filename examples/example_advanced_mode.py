@@ -8,13 +8,16 @@ team recommendations based on your actual cookie collection.
 
 from team_optimizer import Cookie, Team, TeamOptimizer
 
+# Console rules shared by the examples below
+SEPARATOR = "=" * 70
+
 
 def example_basic_vs_advanced():
     """Compare basic rarity-only vs advanced scoring with levels/skills."""
 
-    print("="*70)
+    print(SEPARATOR)
     print("EXAMPLE: Basic vs Advanced Mode Comparison")
-    print("="*70)
+    print(SEPARATOR)
 
     # Same cookie, different modes
     cookie_name = "Shadow Milk Cookie"
@@ -57,17 +60,17 @@ def example_basic_vs_advanced():
     print(f"\n📉 Advanced Mode (New Cookie):")
     print(f"   {new_cookie}")
 
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("💡 Notice how skill level has the biggest impact on power score!")
-    print("="*70)
+    print(SEPARATOR)
 
 
 def example_custom_team():
     """Create a custom team with your actual cookie stats."""
 
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("EXAMPLE: Custom Team with Real Cookie Stats")
-    print("="*70)
+    print(SEPARATOR)
 
     # Create your actual cookies with their real stats
     my_cookies = [
@@ -92,18 +95,18 @@ def example_custom_team():
     print(f"\n🎮 Your Custom Team:")
     print(my_team)
 
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("💡 This team reflects YOUR actual cookie investment!")
     print("   Higher skill levels = better score, even for Epic cookies")
-    print("="*70)
+    print(SEPARATOR)
 
 
 def example_comparison_scenario():
     """Compare two team strategies: high rarity vs high investment."""
 
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("EXAMPLE: High Rarity vs High Investment Strategy")
-    print("="*70)
+    print(SEPARATOR)
 
     # Team 1: All Beast/Ancient but low investment
     high_rarity_team = [
@@ -142,22 +145,22 @@ def example_comparison_scenario():
     print("\n⚡ Team 2: Lower Rarity, High Investment")
     print(team2)
 
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     if team2.composition_score > team1.composition_score:
         print("✅ WINNER: Team 2 (High Investment)")
         print("   Investment in skill levels beats raw rarity!")
     else:
         print("✅ WINNER: Team 1 (High Rarity)")
         print("   Rarity advantage overcame lower investment")
-    print("="*70)
+    print(SEPARATOR)
 
 
 def example_optimizer_with_custom_collection():
     """Example of how to use optimizer with a subset of your collection."""
 
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("EXAMPLE: Optimize Teams from Your Cookie Collection")
-    print("="*70)
+    print(SEPARATOR)
 
     # Simulate your cookie collection with actual stats
     my_collection = [
@@ -185,24 +188,25 @@ def example_optimizer_with_custom_collection():
     # Generate all possible 5-cookie combinations from your collection
     from itertools import combinations
 
-    all_possible_teams = []
+    # Keep only the running best so large collections don't hold every Team in memory
+    best_team = None
+    team_count = 0
     for combo in combinations(my_collection, 5):
         try:
             team = Team(list(combo))
-            all_possible_teams.append(team)
         except ValueError:
             continue
+        team_count += 1
+        if best_team is None or team.composition_score > best_team.composition_score:
+            best_team = team
 
-    # Sort by score
-    all_possible_teams.sort(key=lambda t: t.composition_score, reverse=True)
-
-    print(f"\n📊 Generated {len(all_possible_teams)} possible teams from your collection")
+    print(f"\n📊 Generated {team_count} possible teams from your collection")
     print(f"\n🏆 Your Best Team:")
-    print(all_possible_teams[0])
+    print(best_team)
 
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("💡 TIP: This uses YOUR actual cookie stats for realistic recommendations!")
-    print("="*70)
+    print(SEPARATOR)
 
 
 if __name__ == "__main__":
@@ -212,10 +216,10 @@ if __name__ == "__main__":
     example_comparison_scenario()
     example_optimizer_with_custom_collection()
 
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("✅ Advanced Mode Examples Complete!")
     print("\n💡 Next Steps:")
     print("   1. Update your cookie stats in a separate CSV/JSON")
     print("   2. Load your collection into the optimizer")
     print("   3. Find optimal teams based on YOUR investment")
-    print("="*70)
+    print(SEPARATOR)
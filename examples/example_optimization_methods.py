@@ -8,12 +8,16 @@ and shows how to build teams around specific cookies.
 from team_optimizer import TeamOptimizer
 import time
 
+# Console rules shared by the examples below
+SEPARATOR = "=" * 70
+DIVIDER = "-" * 70
+
 
 def compare_optimization_methods():
     """Compare different optimization algorithms."""
-    print("="*70)
+    print(SEPARATOR)
     print("COMPARING OPTIMIZATION METHODS")
-    print("="*70)
+    print(SEPARATOR)
 
     optimizer = TeamOptimizer('crk-cookies.csv')
 
@@ -26,9 +30,9 @@ def compare_optimization_methods():
     results = {}
 
     for method_name, config in methods.items():
-        print(f"\n{'='*70}")
+        print(f"\n{SEPARATOR}")
         print(f"🔬 Method: {config['description']}")
-        print(f"{'='*70}")
+        print(f"{SEPARATOR}")
 
         start_time = time.time()
 
@@ -59,11 +63,11 @@ def compare_optimization_methods():
             print(best_teams[0])
 
     # Summary comparison
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("📈 SUMMARY COMPARISON")
-    print("="*70)
+    print(SEPARATOR)
     print(f"{'Method':<15} {'Best Score':<12} {'Avg Score':<12} {'Time (s)':<10}")
-    print("-"*70)
+    print(DIVIDER)
 
     for method, data in results.items():
         print(f"{method.capitalize():<15} {data['best_score']:<12.1f} {data['avg_score']:<12.1f} {data['time']:<10.2f}")
@@ -72,23 +76,23 @@ def compare_optimization_methods():
     best_method = max(results.items(), key=lambda x: x[1]['best_score'])
     fastest_method = min(results.items(), key=lambda x: x[1]['time'])
 
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print(f"🏅 Best Score: {best_method[0].capitalize()} ({best_method[1]['best_score']:.1f}/100)")
     print(f"⚡ Fastest: {fastest_method[0].capitalize()} ({fastest_method[1]['time']:.2f}s)")
-    print("="*70)
+    print(SEPARATOR)
 
 
 def build_around_cookie_example():
     """Demonstrate building teams around a specific cookie."""
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("BUILDING TEAMS AROUND SPECIFIC COOKIES")
-    print("="*70)
+    print(SEPARATOR)
 
     optimizer = TeamOptimizer('crk-cookies.csv')
 
     # Example 1: Build around one cookie
     print("\n🎯 Example 1: Build the best team around 'Shadow Milk Cookie'")
-    print("-"*70)
+    print(DIVIDER)
 
     best_teams = optimizer.find_best_teams(
         n=3,
@@ -104,9 +108,9 @@ def build_around_cookie_example():
             print(f"   {marker} {i}. {cookie}")
 
     # Example 2: Build around multiple cookies
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("🎯 Example 2: Build team around 'Pure Vanilla Cookie' + 'Dark Cacao Cookie'")
-    print("-"*70)
+    print(DIVIDER)
 
     best_teams = optimizer.find_best_teams(
         n=3,
@@ -123,12 +127,12 @@ def build_around_cookie_example():
             print(f"   {marker} {i}. {cookie}")
 
     # Example 3: Fill around 3 cookies
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("🎯 Example 3: I have these 3 cookies maxed - who should I pair them with?")
     print("   - Mystic Flour Cookie (Beast, Healer)")
     print("   - Burning Spice Cookie (Beast, Tank)")
     print("   - Shadow Milk Cookie (Beast, DPS)")
-    print("-"*70)
+    print(DIVIDER)
 
     best_teams = optimizer.find_best_teams(
         n=1,
@@ -155,9 +159,9 @@ def build_around_cookie_example():
 
 def exhaustive_search_example():
     """Demonstrate exhaustive search (only practical with required cookies)."""
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("EXHAUSTIVE SEARCH (GUARANTEED OPTIMAL)")
-    print("="*70)
+    print(SEPARATOR)
 
     optimizer = TeamOptimizer('crk-cookies.csv')
 
@@ -169,7 +173,7 @@ def exhaustive_search_example():
     print("   - Burning Spice Cookie (Beast, Tank)")
     print("   - Shadow Milk Cookie (Beast, DPS)")
     print("\n   This reduces search to C(174, 2) = 15,051 combinations")
-    print("-"*70)
+    print(DIVIDER)
 
     start_time = time.time()
 
@@ -185,10 +189,10 @@ def exhaustive_search_example():
     if best_teams:
         print(f"\n✅ Exhaustive search complete in {elapsed:.2f}s")
         print(f"\n🏆 Top 5 GUARANTEED OPTIMAL Teams:")
+        required_names = {'Mystic Flour Cookie', 'Burning Spice Cookie', 'Shadow Milk Cookie'}
 
         for rank, team in enumerate(best_teams, 1):
             print(f"\n--- Rank #{rank} (Score: {team.composition_score:.1f}/100) ---")
-            required_names = {'Mystic Flour Cookie', 'Burning Spice Cookie', 'Shadow Milk Cookie'}
 
             for i, cookie in enumerate(team.cookies, 1):
                 marker = "🔒" if cookie.name in required_names else "➕"
@@ -199,9 +203,9 @@ def exhaustive_search_example():
 
 def practical_use_case():
     """Realistic scenario: User wants to build around their best cookie."""
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("PRACTICAL USE CASE: 'I just got Shadow Milk Cookie!'")
-    print("="*70)
+    print(SEPARATOR)
 
     optimizer = TeamOptimizer('crk-cookies.csv')
 
@@ -210,7 +214,7 @@ def practical_use_case():
     print("   build the strongest possible team around them.\n")
 
     print("🎯 Goal: Find top 5 team compositions featuring Shadow Milk Cookie")
-    print("-"*70)
+    print(DIVIDER)
 
     best_teams = optimizer.find_best_teams(
         n=5,
@@ -244,7 +248,7 @@ if __name__ == "__main__":
     exhaustive_search_example()
     practical_use_case()
 
-    print("\n" + "="*70)
+    print("\n" + SEPARATOR)
     print("✅ All optimization examples complete!")
     print("\n📚 Summary of Methods:")
     print("   - Random: Fast, good for exploration")
@@ -252,4 +256,4 @@ if __name__ == "__main__":
     print("   - Genetic: Slower, often finds better solutions")
     print("   - Exhaustive: Guaranteed optimal (only with required cookies)")
     print("\n💡 For build-around scenarios, use genetic with 50-100 generations!")
-    print("="*70)
+    print(SEPARATOR)
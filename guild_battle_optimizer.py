@@ -14,9 +14,12 @@ Bosses:
     - Machine-God of the Eternal Void
 """
 
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Set, FrozenSet, Callable
 from team_optimizer import Cookie, Team, TeamOptimizer
+import math
 import random
+from bisect import bisect
+from itertools import accumulate
 
 
 # ==================== BOSS PROFILES ====================
@@ -134,6 +137,125 @@ GUILD_BOSSES = {
     }
 }
 
+# One bit per attribute any boss prefers or avoids; a cookie's traits pack into one int
+_GUILD_ATTRIBUTE_BITS = {
+    attr: 1 << i
+    for i, attr in enumerate(sorted({
+        attr
+        for boss in GUILD_BOSSES.values()
+        for attr in boss['preferred_attributes'] + boss['avoid_attributes']
+    }))
+}
+_GUILD_MASK_VALUES = range(1 << len(_GUILD_ATTRIBUTE_BITS))
+
+
+def _attribute_mask(attrs: List[str]) -> int:
+    """
+    Pack attribute names into a bitmask of _GUILD_ATTRIBUTE_BITS.
+
+    Args:
+        attrs: Attribute names (each must be a key of _GUILD_ATTRIBUTE_BITS)
+
+    Returns:
+        int: Bitwise OR of the attributes' bits
+    """
+    mask = 0
+    for attr in attrs:
+        mask |= _GUILD_ATTRIBUTE_BITS[attr]
+    return mask
+
+
+def _make_boss_scorer(
+    tier_bonus: Dict[str, float],
+    attribute_points: Tuple[float, ...]
+) -> Callable[[Cookie, float], float]:
+    """
+    Build a cookie scorer with one boss's tables bound in (no per-call profile lookups).
+
+    Args:
+        tier_bonus: Cookie name -> S/A-tier bonus
+        attribute_points: Attribute points indexed by a cookie's _guild_mask
+
+    Returns:
+        callable: (cookie, power score, attribute mask) -> score from 0-100
+    """
+    bonus_for = tier_bonus.get
+
+    def score(cookie: Cookie, power: float, mask: int) -> float:
+        # S-tier cookies get massive bonus (if prioritization enabled), A-tier a good one
+        base_score = 50.0 + bonus_for(cookie.name, 0.0)
+
+        # Reward preferred and penalize avoided attributes (one table lookup)
+        base_score += attribute_points[mask]
+
+        # Bonus for high power score
+        base_score += power * 2  # Small bonus for power
+
+        return 0.0 if base_score < 0.0 else (100.0 if base_score > 100.0 else base_score)
+
+    return score
+
+
+class _BossProfile:
+    """Scoring view of one GUILD_BOSSES entry: S-tier set, attribute tables and scorers."""
+
+    __slots__ = ('s_tier', 'scorers', 'preferred_mask', 'coverage_points', 'lead_strategy', 'description')
+
+    def __init__(self, boss: Dict):
+        """
+        Build the profile from a GUILD_BOSSES entry.
+
+        Args:
+            boss: Boss dictionary (the lists there stay for ordered display)
+        """
+        self.s_tier: FrozenSet[str] = frozenset(boss['s_tier_cookies'])
+        self.preferred_mask: int = _attribute_mask(boss['preferred_attributes'])
+        avoid_mask = _attribute_mask(boss['avoid_attributes'])
+
+        # Indexed by a cookie (or team) attribute mask: +10 per preferred and -15 per
+        # avoided attribute for one cookie, +3 per preferred attribute covered by a team
+        attribute_points = tuple(
+            10.0 * bin(m & self.preferred_mask).count('1') - 15.0 * bin(m & avoid_mask).count('1')
+            for m in _GUILD_MASK_VALUES
+        )
+        self.coverage_points: Tuple[float, ...] = tuple(
+            3.0 * bin(m & self.preferred_mask).count('1') for m in _GUILD_MASK_VALUES
+        )
+        self.lead_strategy: Optional[str] = boss['strategy'][0] if boss['strategy'] else None
+        self.description: str = boss['description']
+
+        # prioritize_s_tier -> specialized scorer; S-tier wins if a name is listed in both tiers
+        self.scorers: Dict[bool, Callable[[Cookie, float, int], float]] = {}
+        for prioritize, s_bonus, a_bonus in ((True, 40.0, 25.0), (False, 15.0, 10.0)):
+            tier_bonus = dict.fromkeys(boss['a_tier_cookies'], a_bonus)
+            tier_bonus.update(dict.fromkeys(boss['s_tier_cookies'], s_bonus))
+            self.scorers[prioritize] = _make_boss_scorer(tier_bonus, attribute_points)
+
+
+# Boss profiles for scoring
+_BOSS_PROFILES: Dict[str, _BossProfile] = {name: _BossProfile(boss) for name, boss in GUILD_BOSSES.items()}
+
+# Exponential-decay pick weights for the top 15 candidates, and their running totals
+_DECAY_WEIGHTS = tuple(2 ** (15 - i) for i in range(15))
+_CUM_DECAY_WEIGHTS = tuple(accumulate(_DECAY_WEIGHTS))
+
+
+def _guild_mask(cookie: Cookie) -> int:
+    """
+    Compute the boss-relevant attribute mask for a cookie.
+
+    Args:
+        cookie: Cookie to inspect
+
+    Returns:
+        int: Bitwise OR of _GUILD_ATTRIBUTE_BITS for attributes present and truthy on the cookie
+    """
+    mask = 0
+    for attr, bit in _GUILD_ATTRIBUTE_BITS.items():
+        if getattr(cookie, attr, False):
+            mask |= bit
+    return mask
+
 
 # ==================== GUILD BATTLE OPTIMIZER CLASS ====================
 
@@ -148,9 +270,74 @@ class GuildBattleOptimizer:
             optimizer: TeamOptimizer instance with loaded cookies
         """
         self.optimizer = optimizer
+
+        # (id(cookie), boss_name, prioritize_s_tier) -> (cookie, power score, boss score)
+        self._score_cache: Dict[Tuple[int, str, bool], Tuple[Cookie, float, float]] = {}
+
+        # id(cookie) -> (cookie, _guild_mask(cookie)), owned here so a rebuilt optimizer starts fresh
+        self._guild_masks: Dict[int, Tuple[Cookie, int]] = {}
+
         self.all_cookies = optimizer.all_cookies
         self.all_treasures = optimizer.all_treasures
 
+    @property
+    def all_cookies(self) -> List[Cookie]:
+        """Cookie pool used to build guild battle teams."""
+        return self._all_cookies
+
+    @all_cookies.setter
+    def all_cookies(self, cookies: List[Cookie]) -> None:
+        self._all_cookies = cookies
+        self.invalidate_cache()
+
+    def invalidate_cache(self) -> None:
+        """
+        Rebuild the name tables derived from all_cookies and drop memoized scores.
+
+        Called automatically when all_cookies is reassigned; call it manually
+        after mutating the cookie list in place.
+        """
+        cookies = self._all_cookies
+
+        # First cookie with each name, matching a linear scan of the roster
+        self._cookie_by_name: Dict[str, Cookie] = {}
+        for c in cookies:
+            self._cookie_by_name.setdefault(c.name, c)
+
+        # One bit per distinct name, so a team's name set packs into a single int
+        self._name_bits: Dict[str, int] = {name: 1 << i for i, name in enumerate(self._cookie_by_name)}
+
+        self.clear_score_cache()
+
+    def clear_score_cache(self) -> None:
+        """
+        Drop memoized cookie-vs-boss scores and cookie attribute masks.
+
+        Entries already re-score when a cookie's power score changes; call this
+        after editing other cookie attributes.
+        """
+        self._score_cache.clear()
+        self._guild_masks.clear()
+
+    def _attribute_mask(self, cookie: Cookie) -> int:
+        """
+        Get a cookie's boss-relevant attribute mask, computing it once per Cookie object.
+
+        Args:
+            cookie: Cookie to inspect
+
+        Returns:
+            int: The cookie's _guild_mask
+        """
+        # The entry holds the cookie so its id cannot be reused by another object
+        entry = self._guild_masks.get(id(cookie))
+        if entry is not None and entry[0] is cookie:
+            return entry[1]
+
+        mask = _guild_mask(cookie)
+        self._guild_masks[id(cookie)] = (cookie, mask)
+        return mask
+
     def get_boss_info(self, boss_name: str) -> Dict:
         """
         Get detailed information about a Guild Battle boss.
@@ -175,41 +362,78 @@ class GuildBattleOptimizer:
         Returns:
             float: Score from 0-100 (higher is better)
         """
-        boss = GUILD_BOSSES.get(boss_name, {})
-        if not boss:
+        profile = _BOSS_PROFILES.get(boss_name)
+        if profile is None:
             return 50.0  # Neutral score if boss not found
 
-        base_score = 50.0
+        # The entry holds the cookie so its id cannot be reused by another object
+        power = cookie.get_power_score()
+        key = (id(cookie), boss_name, prioritize_s_tier)
+        cached = self._score_cache.get(key)
+        if cached is not None and cached[0] is cookie and cached[1] == power:
+            return cached[2]
+
+        score = profile.scorers[bool(prioritize_s_tier)](cookie, power, self._attribute_mask(cookie))
+        self._score_cache[key] = (cookie, power, score)
+        return score
 
-        # S-tier cookies get massive bonus (if prioritization enabled)
-        if cookie.name in boss['s_tier_cookies']:
-            base_score += 40.0 if prioritize_s_tier else 15.0
+    def score_all_cookies_for_boss(self, boss_name: str, prioritize_s_tier: bool = True) -> List[float]:
+        """
+        Score every loaded cookie against a boss in one pass.
 
-        # A-tier cookies get good bonus
-        elif cookie.name in boss['a_tier_cookies']:
-            base_score += 25.0 if prioritize_s_tier else 10.0
+        Equivalent to calling score_cookie_for_boss per cookie, but the boss's
+        specialized scorer is resolved once for the whole roster.
 
-        # Check preferred attributes
-        for attr in boss['preferred_attributes']:
-            if hasattr(cookie, attr) and getattr(cookie, attr):
-                base_score += 10.0
+        Args:
+            boss_name: Name of the boss
+            prioritize_s_tier: If True, give massive bonus to S-tier cookies
 
-        # Penalize avoided attributes
-        for attr in boss['avoid_attributes']:
-            if hasattr(cookie, attr) and getattr(cookie, attr):
-                base_score -= 15.0
+        Returns:
+            list: Scores from 0-100, aligned with self.all_cookies
+        """
+        score_map = self._score_map_for_boss(boss_name, prioritize_s_tier)
+        return [score_map[id(c)] for c in self.all_cookies]
 
-        # Bonus for high power score
-        base_score += cookie.get_power_score() * 2  # Small bonus for power
+    def _score_map_for_boss(self, boss_name: str, prioritize_s_tier: bool) -> Dict[int, float]:
+        """
+        Score every loaded cookie against a boss, keyed for lookups by cookie object.
 
-        return min(100.0, max(0.0, base_score))
+        Args:
+            boss_name: Name of the boss
+            prioritize_s_tier: If True, give massive bonus to S-tier cookies
+
+        Returns:
+            dict: id(cookie) -> score from 0-100 (only valid while the cookies are alive)
+        """
+        profile = _BOSS_PROFILES.get(boss_name)
+        if profile is None:
+            return {id(c): 50.0 for c in self.all_cookies}
+
+        score_one = profile.scorers[bool(prioritize_s_tier)]
+        cache = self._score_cache
+
+        scores = {}
+        for cookie in self.all_cookies:
+            power = cookie.get_power_score()
+            key = (id(cookie), boss_name, prioritize_s_tier)
+            cached = cache.get(key)
+            if cached is not None and cached[0] is cookie and cached[1] == power:
+                scores[key[0]] = cached[2]
+                continue
+
+            score = score_one(cookie, power, self._attribute_mask(cookie))
+            cache[key] = (cookie, power, score)
+            scores[key[0]] = score
+
+        return scores
 
     def generate_guild_battle_team(
         self,
         boss_name: str,
         required_cookies: Optional[List[str]] = None,
         num_teams: int = 5,
-        prioritize_s_tier: bool = True
+        prioritize_s_tier: bool = True,
+        rng: Optional[random.Random] = None
     ) -> List[Dict]:
         """
         Generate optimized teams for a Guild Battle boss.
@@ -219,67 +443,71 @@ class GuildBattleOptimizer:
             required_cookies: List of cookie names that must be included
             num_teams: Number of team variations to generate
             prioritize_s_tier: If True, heavily prioritize S-tier cookies for this boss
+            rng: Random generator for the weighted picks (defaults to the shared
+                random module, so random.seed() still controls the result)
 
         Returns:
             list: List of team dictionaries with scores and strategies
         """
-        boss = GUILD_BOSSES.get(boss_name)
-        if not boss:
+        profile = _BOSS_PROFILES.get(boss_name)
+        if profile is None:
             raise ValueError(f"Unknown boss: {boss_name}")
 
         # Get required cookies
         required = []
         if required_cookies:
             for name in required_cookies:
-                cookie = next((c for c in self.all_cookies if c.name == name), None)
+                cookie = self._cookie_by_name.get(name)
                 if cookie:
                     required.append(cookie)
 
-        # Score all cookies for this boss
+        # Score every cookie for this boss once; candidate teams reuse the table
+        score_map = self._score_map_for_boss(boss_name, prioritize_s_tier)
+
+        s_tier = profile.s_tier
         cookie_scores = []
         for cookie in self.all_cookies:
             if cookie not in required:
                 # Skip S-tier cookies if prioritization is disabled
-                if not prioritize_s_tier and cookie.name in boss['s_tier_cookies']:
+                if not prioritize_s_tier and cookie.name in s_tier:
                     continue
 
-                score = self.score_cookie_for_boss(cookie, boss_name, prioritize_s_tier)
-                cookie_scores.append((cookie, score))
+                cookie_scores.append((cookie, score_map[id(cookie)]))
 
-        # Sort by score (highest first)
+        # Sort by score (highest first); required cookies are already left out, so
+        # every attempt can start from a copy of this ranking
         cookie_scores.sort(key=lambda x: x[1], reverse=True)
+        ranked = [c for c, s in cookie_scores]
+
+        # No attempt can fill the team if the pool is smaller than the open slots
+        open_slots = 5 - len(required)
+        if open_slots < 0 or len(cookie_scores) < open_slots:
+            return []
+
+        # Each pick comes from the top 15 remaining, so the j-th pick can reach at most
+        # pool rank 13 + j: every reachable team lies within the first 14 + open_slots
+        # (n choose k spelled out with factorials - math.comb needs Python 3.8)
+        reach = min(len(cookie_scores), 14 + open_slots)
+        max_unique = math.factorial(reach) // (math.factorial(open_slots) * math.factorial(reach - open_slots))
 
         # Generate teams
         teams = []
-        used_combinations = set()
+        used_combinations: Set[int] = set()
+        name_bits = self._name_bits
+        draw = rng.random if rng is not None else random.random
 
         for attempt in range(num_teams * 10):  # Try multiple times
-            if len(teams) >= num_teams:
+            # Stop once enough teams exist or every reachable combination was seen
+            if len(teams) >= num_teams or len(used_combinations) >= max_unique:
                 break
 
-            # Start with required cookies
-            team_cookies = required.copy()
-
-            # Add top-scored cookies with some randomness
-            available = [c for c, s in cookie_scores if c not in team_cookies]
-
-            # Weighted random selection (higher scores = higher probability)
-            while len(team_cookies) < 5 and available:
-                # Take top candidates with bias toward higher scores
-                top_candidates = available[:min(15, len(available))]
+            # Always 5 cookies: the pool was checked to cover the open slots
+            team_cookies = self._sample_team(required, ranked, draw)
 
-                # Weight by position (exponential decay)
-                weights = [2 ** (15 - i) for i in range(len(top_candidates))]
-                selected = random.choices(top_candidates, weights=weights, k=1)[0]
-
-                team_cookies.append(selected)
-                available.remove(selected)
-
-            if len(team_cookies) != 5:
-                continue
-
-            # Check for duplicates
-            team_key = tuple(sorted([c.name for c in team_cookies]))
+            # Check for duplicates (OR of name bits is order-independent)
+            team_key = 0
+            for c in team_cookies:
+                team_key |= name_bits[c.name]
             if team_key in used_combinations:
                 continue
 
@@ -288,13 +516,18 @@ class GuildBattleOptimizer:
             # Create team and score it
             try:
                 team = Team(team_cookies)
-                team_score = self.score_team_for_boss(team, boss_name, prioritize_s_tier)
+
+                # S-tier members in team order, shared by the score and the strategy text
+                s_tier_in_team = [c.name for c in team.cookies if c.name in s_tier]
+                team_score = self.score_team_for_boss(
+                    team, boss_name, prioritize_s_tier, score_map, s_tier_in_team
+                )
 
                 teams.append({
                     'team': team,
                     'score': team_score,
                     'boss': boss_name,
-                    'strategy': self.generate_team_strategy(team, boss_name)
+                    'strategy': self.generate_team_strategy(team, boss_name, s_tier_in_team)
                 })
             except ValueError:
                 continue
@@ -304,7 +537,55 @@ class GuildBattleOptimizer:
 
         return teams[:num_teams]
 
-    def score_team_for_boss(self, team: Team, boss_name: str, prioritize_s_tier: bool = True) -> float:
+    @staticmethod
+    def _sample_team(
+        required: List[Cookie],
+        ranked: List[Cookie],
+        draw: Callable[[], float]
+    ) -> List[Cookie]:
+        """
+        Draw one candidate team: the required cookies plus weighted picks.
+
+        Each pick takes one of the top 15 remaining cookies with exponentially
+        decaying weight by rank. The draw inlines random.choices (bisect over the
+        cumulative weights) so it consumes the random stream identically.
+
+        Args:
+            required: Cookies every team must include
+            ranked: Non-required cookies sorted by score, highest first (not modified)
+            draw: Uniform [0, 1) source, e.g. random.random
+
+        Returns:
+            list: Team cookies (fewer than 5 if the pool ran out)
+        """
+        # Start with required cookies
+        team_cookies = required.copy()
+
+        # Add top-scored cookies with some randomness
+        available = ranked.copy()
+
+        # Weighted random selection (higher scores = higher probability); the slot
+        # count is fixed up front, so no length or emptiness check per pick
+        for _ in range(min(5 - len(team_cookies), len(available))):
+            # Take top candidates with bias toward higher scores
+            hi = min(15, len(available)) - 1
+
+            # Weight by position (exponential decay); the cumulative prefix up to
+            # hi is the window's cumulative weights
+            index = bisect(_CUM_DECAY_WEIGHTS, draw() * _CUM_DECAY_WEIGHTS[hi], 0, hi)
+
+            team_cookies.append(available.pop(index))
+
+        return team_cookies
+
+    def score_team_for_boss(
+        self,
+        team: Team,
+        boss_name: str,
+        prioritize_s_tier: bool = True,
+        score_map: Optional[Dict[int, float]] = None,
+        s_tier_in_team: Optional[List[str]] = None
+    ) -> float:
         """
         Score a team's effectiveness against a boss.
 
@@ -312,48 +593,67 @@ class GuildBattleOptimizer:
             team: Team to evaluate
             boss_name: Name of the boss
             prioritize_s_tier: If True, give extra bonus to S-tier cookies
+            score_map: Optional id(cookie) -> score table from _score_map_for_boss with
+                the same boss and prioritize_s_tier (skips rescoring each member)
+            s_tier_in_team: Optional names of the team's S-tier cookies for this boss
+                (skips the membership scan)
 
         Returns:
             float: Team score (0-100)
         """
-        boss = GUILD_BOSSES.get(boss_name, {})
-
         # Average individual cookie scores
-        cookie_scores = [self.score_cookie_for_boss(c, boss_name, prioritize_s_tier) for c in team.cookies]
+        if score_map is not None:
+            cookie_scores = [score_map[id(c)] for c in team.cookies]
+        else:
+            cookie_scores = [self.score_cookie_for_boss(c, boss_name, prioritize_s_tier) for c in team.cookies]
         avg_score = sum(cookie_scores) / len(cookie_scores)
 
         # Bonus for team synergy
         synergy_bonus = min(10.0, team.synergy_score / 5)
 
+        profile = _BOSS_PROFILES[boss_name]
+
         # Bonus for having S-tier cookies (only if prioritization enabled)
-        s_tier_count = sum(1 for c in team.cookies if c.name in boss['s_tier_cookies'])
+        if s_tier_in_team is not None:
+            s_tier_count = len(s_tier_in_team)
+        else:
+            s_tier = profile.s_tier
+            s_tier_count = sum(1 for c in team.cookies if c.name in s_tier)
         s_tier_bonus = (s_tier_count * 5.0) if prioritize_s_tier else (s_tier_count * 2.0)
 
         # Check attribute coverage
-        coverage_bonus = 0
-        for attr in boss['preferred_attributes']:
-            if any(hasattr(c, attr) and getattr(c, attr) for c in team.cookies):
-                coverage_bonus += 3.0
+        covered = 0
+        for c in team.cookies:
+            covered |= self._attribute_mask(c)
+        coverage_bonus = profile.coverage_points[covered]
 
         total_score = avg_score + synergy_bonus + s_tier_bonus + coverage_bonus
 
         return min(100.0, total_score)
 
-    def generate_team_strategy(self, team: Team, boss_name: str) -> str:
+    def generate_team_strategy(
+        self,
+        team: Team,
+        boss_name: str,
+        s_tier_in_team: Optional[List[str]] = None
+    ) -> str:
         """
         Generate strategic recommendations for a team against a boss.
 
         Args:
             team: The team composition
             boss_name: Name of the boss
+            s_tier_in_team: Optional names of the team's S-tier cookies for this boss,
+                in team order (computed from the team when omitted)
 
         Returns:
             str: Strategy description
         """
-        boss = GUILD_BOSSES.get(boss_name, {})
+        profile = _BOSS_PROFILES[boss_name]
 
-        cookie_names = [c.name for c in team.cookies]
-        s_tier_in_team = [c for c in cookie_names if c in boss['s_tier_cookies']]
+        if s_tier_in_team is None:
+            s_tier = profile.s_tier
+            s_tier_in_team = [c.name for c in team.cookies if c.name in s_tier]
 
         strategy_parts = []
 
@@ -365,7 +665,7 @@ class GuildBattleOptimizer:
                 strategy_parts.append(f"★ Focus on: {', '.join(s_tier_in_team[:2])}")
 
         # Add boss-specific strategy
-        if boss['strategy']:
-            strategy_parts.append(boss['strategy'][0])
+        if profile.lead_strategy:
+            strategy_parts.append(profile.lead_strategy)
 
-        return ' '.join(strategy_parts) if strategy_parts else boss['description']
+        return ' '.join(strategy_parts) if strategy_parts else profile.description
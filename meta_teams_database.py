@@ -10,7 +10,12 @@ Sources:
 - https://gamerant.com/cookie-run-kingdom-best-team-builds-kingdom-arena-meta/
 """
 
-from typing import Dict, List, Optional
+import heapq
+import sys
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
 # Meta team compositions for 2025 Arena
 META_TEAMS = {
@@ -475,7 +480,139 @@ TREASURE_STRATEGIES = {
 }
 
 
-def get_meta_team(team_name: str) -> Optional[Dict]:
+# META_TEAMS fields that hold cookie or treasure name lists
+_META_NAME_LIST_FIELDS = ('core_cookies', 'typical_composition', 'counter_cookies', 'recommended_treasures')
+
+
+def _intern_names() -> None:
+    """
+    Intern every cookie and treasure name in the tables above, in place.
+
+    Names repeat across teams, counters and strategies; interning leaves one
+    shared object per name, so lookups with interned names hit the identity
+    fast path instead of comparing string contents.
+    """
+    intern = sys.intern
+    for team in META_TEAMS.values():
+        for field in _META_NAME_LIST_FIELDS:
+            team[field] = [intern(name) for name in team[field]]
+        team['alternative_cookies'] = {
+            intern(name): [intern(alt) for alt in alternatives]
+            for name, alternatives in team['alternative_cookies'].items()
+        }
+
+    # Rebuild in place so the table keeps its order
+    counters = list(COOKIE_COUNTERS.items())
+    COOKIE_COUNTERS.clear()
+    for name, info in counters:
+        info['counters'] = [intern(counter) for counter in info['counters']]
+        COOKIE_COUNTERS[intern(name)] = info
+
+    for strategy in TREASURE_STRATEGIES.values():
+        for slot in ('primary', 'secondary', 'tertiary'):
+            strategy[slot] = intern(strategy[slot])
+
+
+def _freeze(value):
+    """
+    Recursively convert dicts to read-only mappings and lists to tuples.
+
+    Args:
+        value: Table value to freeze
+
+    Returns:
+        MappingProxyType for dicts, tuple for lists, the value itself otherwise
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+_intern_names()
+
+# The tables are shared by every caller (and cached results), so expose them read-only
+META_TEAMS = _freeze(META_TEAMS)
+COOKIE_COUNTERS = _freeze(COOKIE_COUNTERS)
+TREASURE_STRATEGIES = _freeze(TREASURE_STRATEGIES)
+
+# Per-team name sets for O(1) "team contains cookie" checks
+_META_CORE_SETS = {name: frozenset(team['core_cookies']) for name, team in META_TEAMS.items()}
+_META_COMPOSITION_SETS = {name: frozenset(team['typical_composition']) for name, team in META_TEAMS.items()}
+
+
+def _invert_meta_teams(field: str) -> Mapping[str, Tuple[str, ...]]:
+    """
+    Index META_TEAMS by the names listed in one of its fields.
+
+    Args:
+        field: META_TEAMS list field to index (e.g. 'typical_composition')
+
+    Returns:
+        Read-only mapping of name -> meta team names listing it, in META_TEAMS order
+    """
+    index: Dict[str, List[str]] = {}
+    for team_name, team in META_TEAMS.items():
+        for name in dict.fromkeys(team[field]):
+            index.setdefault(name, []).append(team_name)
+    return _freeze(index)
+
+
+# Inverted indexes: cookie / treasure name -> meta teams that use it
+COOKIE_TO_TEAMS = _invert_meta_teams('typical_composition')
+TREASURE_TO_TEAMS = _invert_meta_teams('recommended_treasures')
+
+
+# Threat categories inferred from enemy cookie names: (category, level, name substrings)
+THREAT_NAME_PATTERNS = (
+    ('crowd_control', 8, ('Shadow Milk', 'Mystic Flour', 'Frost Queen')),
+    ('burst_damage', 9, ('Burning Spice', 'Silent Salt')),
+    ('sustained_damage', 7, ('Black Pearl', 'Moonlight', 'Stormbringer')),
+    ('tank', 8, ('Hollyberry', 'Dark Cacao')),
+    ('healing', 7, ('Doughael', 'Pure Vanilla', 'Cotton')),
+)
+
+# Counter strategies checked in order: (threat category, minimum level, strategy, treasures)
+STRATEGY_TABLE = (
+    ('crowd_control', 7,
+     "Use Cream Ferret Cookie for cleanse and anti-CC. Prioritize debuff removal and immunity.",
+     ("Librarian's Enchanted Robes", "Sugar Swan's Shining Feather")),
+    ('burst_damage', 8,
+     "Use high HP tanks with damage reduction. Hollyberry (Ascended) or Dark Cacao (Ascended) essential.",
+     ("Sugar Swan's Shining Feather", "Sacred Pomegranate Branch")),
+    ('sustained_damage', 7,
+     "Focus on burst damage to eliminate threats quickly. Shadow Milk lockdown critical.",
+     ("Old Pilgrim's Scroll", "Jelly Watch")),
+)
+
+# Strategy used when no threat reaches its STRATEGY_TABLE level
+DEFAULT_STRATEGY = (
+    "Balanced team composition. Match their sustain or out-damage them.",
+    ("Old Pilgrim's Scroll", "Sugar Swan's Shining Feather"),
+)
+
+
+# Bounded: names come from callers, not just the tables above
+@lru_cache(maxsize=1024)
+def _threat_mask(cookie_name: str) -> int:
+    """
+    Get the threat categories a cookie name matches, scanning THREAT_NAME_PATTERNS once per name.
+
+    Args:
+        cookie_name: Enemy cookie name
+
+    Returns:
+        Bitmask with bit i set when THREAT_NAME_PATTERNS[i] matches
+    """
+    mask = 0
+    for bit, (_, _, fragments) in enumerate(THREAT_NAME_PATTERNS):
+        if any(fragment in cookie_name for fragment in fragments):
+            mask |= 1 << bit
+    return mask
+
+
+def get_meta_team(team_name: str) -> Optional[Mapping]:
     """
     Retrieve meta team information by name.
 
@@ -483,12 +620,12 @@ def get_meta_team(team_name: str) -> Optional[Dict]:
         team_name: Name of the meta team
 
     Returns:
-        Dict containing team information, or None if not found
+        Read-only mapping containing team information (lists are tuples), or None if not found
     """
     return META_TEAMS.get(team_name)
 
 
-def get_cookie_counters(cookie_name: str) -> Optional[Dict]:
+def get_cookie_counters(cookie_name: str) -> Optional[Mapping]:
     """
     Get counter information for a specific cookie.
 
@@ -496,11 +633,48 @@ def get_cookie_counters(cookie_name: str) -> Optional[Dict]:
         cookie_name: Name of the cookie
 
     Returns:
-        Dict containing counter information, or None if not found
+        Read-only mapping containing counter information (lists are tuples), or None if not found
     """
     return COOKIE_COUNTERS.get(cookie_name)
 
 
+def get_meta_teams_with_cookie(cookie_name: str) -> Tuple[str, ...]:
+    """
+    Get the meta teams whose typical composition includes a cookie.
+
+    Args:
+        cookie_name: Name of the cookie
+
+    Returns:
+        Tuple of meta team names in META_TEAMS order (empty if none)
+    """
+    return COOKIE_TO_TEAMS.get(cookie_name, ())
+
+
+def identify_likely_meta_team(enemy_cookies: List[str]) -> Optional[str]:
+    """
+    Identify the meta team an enemy lineup most resembles.
+
+    Teams are ranked by overlap with their typical composition, then by how many
+    core cookies the enemy fields; ties keep META_TEAMS order. A team only
+    matches if at least one of its core cookies is present.
+
+    Args:
+        enemy_cookies: List of enemy cookie names
+
+    Returns:
+        Name of the best-matching meta team, or None if no core cookie is present
+    """
+    enemy = frozenset(enemy_cookies)
+    best_name = None
+    best_key = (0, 0)
+    for name, composition in _META_COMPOSITION_SETS.items():
+        key = (len(enemy & composition), len(enemy & _META_CORE_SETS[name]))
+        if key > best_key and key[1] > 0:
+            best_name, best_key = name, key
+    return best_name
+
+
 def analyze_enemy_team_threats(enemy_cookies: List[str]) -> Dict:
     """
     Analyze enemy team and identify threat levels.
@@ -512,6 +686,7 @@ def analyze_enemy_team_threats(enemy_cookies: List[str]) -> Dict:
         Dict containing threat analysis
     """
     total_threat = 0
+    threat_mask = 0
     threats_breakdown = {
         'burst_damage': 0,
         'sustained_damage': 0,
@@ -534,21 +709,13 @@ def analyze_enemy_team_threats(enemy_cookies: List[str]) -> Dict:
                     'threats': counter_info['primary_threats']
                 })
 
-    # Estimate threat types based on cookie names/roles
-    if any('Shadow Milk' in c or 'Mystic Flour' in c or 'Frost Queen' in c for c in enemy_cookies):
-        threats_breakdown['crowd_control'] = 8
-
-    if any('Burning Spice' in c or 'Silent Salt' in c for c in enemy_cookies):
-        threats_breakdown['burst_damage'] = 9
+        # Estimate threat types based on cookie names/roles
+        threat_mask |= _threat_mask(cookie)
 
-    if any('Black Pearl' in c or 'Moonlight' in c or 'Stormbringer' in c for c in enemy_cookies):
-        threats_breakdown['sustained_damage'] = 7
-
-    if any('Hollyberry' in c or 'Dark Cacao' in c for c in enemy_cookies):
-        threats_breakdown['tank'] = 8
-
-    if any('Doughael' in c or 'Pure Vanilla' in c or 'Cotton' in c for c in enemy_cookies):
-        threats_breakdown['healing'] = 7
+    # Each matched category carries its fixed level, so decode the union once
+    for bit, (category, level, _) in enumerate(THREAT_NAME_PATTERNS):
+        if threat_mask >> bit & 1:
+            threats_breakdown[category] = level
 
     return {
         'total_threat_level': total_threat,
@@ -561,55 +728,67 @@ def recommend_counter_team(enemy_cookies: List[str]) -> Dict:
     """
     Recommend counter team based on enemy composition.
 
+    Results are memoized per enemy list; each call returns fresh lists, so
+    callers may modify the returned dict freely.
+
     Args:
         enemy_cookies: List of enemy cookie names
 
     Returns:
         Dict with recommended counter cookies and strategy
     """
-    counter_recommendations = {
-        'recommended_cookies': [],
-        'strategy': "",
-        'treasures': [],
-        'priority_targets': []
+    recommended, strategy, treasures, priority_targets = _recommend_counter_team_cached(tuple(enemy_cookies))
+    return {
+        'recommended_cookies': list(recommended),
+        'strategy': strategy,
+        'treasures': list(treasures),
+        'priority_targets': list(priority_targets)
     }
 
+
+@lru_cache(maxsize=4096)
+def _recommend_counter_team_cached(
+    enemy_cookies: Tuple[str, ...]
+) -> Tuple[Tuple[str, ...], str, Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Compute counter recommendations for an enemy lineup (cached).
+
+    The key keeps order and duplicates: both decide counter tie-breaks and
+    the priority target list.
+
+    Args:
+        enemy_cookies: Enemy cookie names in lineup order
+
+    Returns:
+        Tuple of (recommended cookies, strategy, treasures, priority targets)
+    """
+    priority_targets = []
+
     # Analyze threats
     threat_analysis = analyze_enemy_team_threats(enemy_cookies)
 
-    # Collect all recommended counters
-    all_counters = []
+    # Count recommended counters as they are collected (insertion order breaks ties)
+    counter_counts: Dict[str, int] = {}
     for cookie in enemy_cookies:
         counter_info = COOKIE_COUNTERS.get(cookie)
         if counter_info:
-            all_counters.extend(counter_info['counters'])
+            for counter in counter_info['counters']:
+                counter_counts[counter] = counter_counts.get(counter, 0) + 1
             if counter_info['threat_level'] >= 8:
-                counter_recommendations['priority_targets'].append(cookie)
+                priority_targets.append(cookie)
 
-    # Count most recommended counters
-    from collections import Counter
-    counter_counts = Counter(all_counters)
-    top_counters = counter_counts.most_common(5)
+    # Top 5 most recommended counters (partial selection, no full sort)
+    top_counters = heapq.nlargest(5, counter_counts.items(), key=itemgetter(1))
 
-    counter_recommendations['recommended_cookies'] = [c[0] for c in top_counters]
+    recommended_cookies = tuple(c[0] for c in top_counters)
 
     # Determine strategy based on threat types
     threats = threat_analysis['threats_breakdown']
 
-    if threats['crowd_control'] >= 7:
-        counter_recommendations['strategy'] = "Use Cream Ferret Cookie for cleanse and anti-CC. Prioritize debuff removal and immunity."
-        counter_recommendations['treasures'] = ["Librarian's Enchanted Robes", "Sugar Swan's Shining Feather"]
-
-    elif threats['burst_damage'] >= 8:
-        counter_recommendations['strategy'] = "Use high HP tanks with damage reduction. Hollyberry (Ascended) or Dark Cacao (Ascended) essential."
-        counter_recommendations['treasures'] = ["Sugar Swan's Shining Feather", "Sacred Pomegranate Branch"]
-
-    elif threats['sustained_damage'] >= 7:
-        counter_recommendations['strategy'] = "Focus on burst damage to eliminate threats quickly. Shadow Milk lockdown critical."
-        counter_recommendations['treasures'] = ["Old Pilgrim's Scroll", "Jelly Watch"]
-
+    for category, level, strategy, treasures in STRATEGY_TABLE:
+        if threats[category] >= level:
+            break
     else:
-        counter_recommendations['strategy'] = "Balanced team composition. Match their sustain or out-damage them."
-        counter_recommendations['treasures'] = ["Old Pilgrim's Scroll", "Sugar Swan's Shining Feather"]
+        strategy, treasures = DEFAULT_STRATEGY
 
-    return counter_recommendations
+    return recommended_cookies, strategy, treasures, tuple(priority_targets)
@@ -1,15 +1,14 @@
 #!/usr/bin/env python3
 """Fix cookie_abilities.csv to use correct Ascended cookie names."""
 
-import pandas as pd
-
-# Load the abilities CSV
-df = pd.read_csv('cookie_abilities.csv')
+import io
+import sys
+from functools import partial
 
-print(f"Total abilities before fix: {len(df)}")
+import pandas as pd
 
 # Map of Awakened skill names to Ascended cookie names
-awakened_skills = {
+AWAKENED_SKILLS = {
     'Awakened Light of Unwavering Resolution': 'Pure Vanilla Cookie (Ascended)',
     'Awakened Grand Entrance': 'Hollyberry Cookie (Ascended)',
     'Awakened Grapejam Chocoblade': 'Dark Cacao Cookie (Ascended)',
@@ -17,31 +16,61 @@ awakened_skills = {
     'Awakened Final Verdict': 'White Lily Cookie (Ascended)'
 }
 
-print("\nUpdating Awakened skill cookie names:")
-for skill_name, new_cookie_name in awakened_skills.items():
-    mask = df['skill_name'] == skill_name
-    old_name = df.loc[mask, 'cookie_name'].values[0] if mask.any() else 'NOT FOUND'
-    df.loc[mask, 'cookie_name'] = new_cookie_name
-    print(f"  {old_name} -> {new_cookie_name}")
-
-# Check for duplicates
-duplicates = df[df.duplicated(subset=['cookie_name'], keep=False)]
-if len(duplicates) > 0:
-    print(f"\n⚠️ WARNING: Found {len(duplicates)} duplicate cookie names:")
-    print(duplicates[['cookie_name', 'skill_name']].to_string())
-else:
-    print(f"\n✓ No duplicate cookie names found!")
-
-# Verify the fix
-print("\n=== Verification ===")
-for base_name in ['Pure Vanilla Cookie', 'Hollyberry Cookie', 'Dark Cacao Cookie',
-                   'Golden Cheese Cookie', 'White Lily Cookie']:
-    base_count = len(df[df['cookie_name'] == base_name])
-    ascended_name = f"{base_name} (Ascended)"
-    ascended_count = len(df[df['cookie_name'] == ascended_name])
-    print(f"{base_name}: {base_count} | {ascended_name}: {ascended_count}")
-
-# Save the fixed CSV
-df.to_csv('cookie_abilities.csv', index=False)
-print(f"\n✓ Saved fixed CSV to cookie_abilities.csv")
-print(f"Total abilities after fix: {len(df)}")
+
+def main():
+    """
+    Point the Awakened skills in cookie_abilities.csv at the Ascended cookies and report the changes.
+    """
+    # Collect the report in memory and write it to stdout once at the end
+    buf = io.StringIO()
+    report = partial(print, file=buf)
+
+    # Load the abilities CSV as text: every column is written back, so skipping type inference
+    # is faster and keeps values unchanged
+    df = pd.read_csv('cookie_abilities.csv', dtype=str, keep_default_na=False)
+
+    report(f"Total abilities before fix: {len(df)}")
+
+    report("\nUpdating Awakened skill cookie names:")
+    # One hash lookup per row instead of a full-column comparison per skill
+    new_names = df['skill_name'].map(AWAKENED_SKILLS)
+    mask = new_names.notna()
+    # Current cookie name of the first row with each Awakened skill, for the report
+    old_names = df.loc[mask].drop_duplicates('skill_name').set_index('skill_name')['cookie_name']
+    # Only rows whose name actually changes make a rewrite worthwhile
+    changed = (df.loc[mask, 'cookie_name'] != new_names[mask]).any()
+    df.loc[mask, 'cookie_name'] = new_names[mask]
+    for skill_name, new_cookie_name in AWAKENED_SKILLS.items():
+        report(f"  {old_names.get(skill_name, 'NOT FOUND')} -> {new_cookie_name}")
+
+    # Check for duplicates
+    duplicates = df[df.duplicated(subset=['cookie_name'], keep=False)]
+    if len(duplicates) > 0:
+        report(f"\n⚠️ WARNING: Found {len(duplicates)} duplicate cookie names:")
+        report(duplicates[['cookie_name', 'skill_name']].to_string())
+    else:
+        report(f"\n✓ No duplicate cookie names found!")
+
+    # Verify the fix (count every name in one hashing pass instead of ten column scans)
+    report("\n=== Verification ===")
+    name_counts = df['cookie_name'].value_counts()
+    for base_name in ['Pure Vanilla Cookie', 'Hollyberry Cookie', 'Dark Cacao Cookie',
+                       'Golden Cheese Cookie', 'White Lily Cookie']:
+        base_count = name_counts.get(base_name, 0)
+        ascended_name = f"{base_name} (Ascended)"
+        ascended_count = name_counts.get(ascended_name, 0)
+        report(f"{base_name}: {base_count} | {ascended_name}: {ascended_count}")
+
+    # Save the fixed CSV (skip the rewrite when the names were already correct)
+    if changed:
+        df.to_csv('cookie_abilities.csv', index=False)
+        report(f"\n✓ Saved fixed CSV to cookie_abilities.csv")
+    else:
+        report(f"\n✓ No names changed, cookie_abilities.csv left as is")
+    report(f"Total abilities after fix: {len(df)}")
+
+    sys.stdout.write(buf.getvalue())
+
+
+if __name__ == "__main__":
+    main()
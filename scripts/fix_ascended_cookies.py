@@ -1,42 +1,68 @@
 #!/usr/bin/env python3
 """Fix Ascended cookies by renaming them to avoid duplicates."""
 
+import io
+import sys
+from functools import partial
+
 import pandas as pd
 
-# Read the CSV
-df = pd.read_csv('crk-cookies.csv')
+def main():
+    """
+    Rename the Ascended cookies in crk-cookies.csv and report the changes.
+    """
+    # Collect the report in memory and write it to stdout once at the end
+    buf = io.StringIO()
+    report = partial(print, file=buf)
+
+    # Read the CSV as text: every column is written back, so skipping type inference
+    # is faster and keeps values unchanged
+    df = pd.read_csv('crk-cookies.csv', dtype=str, keep_default_na=False)
+
+    report(f"Total cookies before fix: {len(df)}")
+    report(f"\nCookies with 'Ascended' rarity:")
+
+    # Find Ascended cookies
+    ascended_mask = df['cookie_rarity'].str.contains('Ascended', na=False)
+    ascended_cookies = df[ascended_mask]
+
+    report(f"Found {len(ascended_cookies)} Ascended cookies:")
+    for idx, row in ascended_cookies.iterrows():
+        report(f"  - {row['cookie_name']} ({row['cookie_rarity']})")
 
-print(f"Total cookies before fix: {len(df)}")
-print(f"\nCookies with 'Ascended' rarity:")
+    # Rename Ascended cookies by appending (Ascended) to their names
+    # (edits the name array in place instead of building aligned .loc Series)
+    names = df['cookie_name'].to_numpy(dtype=object, copy=True)
+    mask = ascended_mask.to_numpy()
+    names[mask] = names[mask] + ' (Ascended)'
+    df['cookie_name'] = names
 
-# Find Ascended cookies
-ascended_mask = df['cookie_rarity'].str.contains('Ascended', na=False)
-ascended_cookies = df[ascended_mask]
+    # Also simplify the rarity from "Ancient (Ascended)" to just "Ancient (Ascended)"
+    # Keep it as is for now to maintain the distinction
 
-print(f"Found {len(ascended_cookies)} Ascended cookies:")
-for idx, row in ascended_cookies.iterrows():
-    print(f"  - {row['cookie_name']} ({row['cookie_rarity']})")
+    report(f"\nAfter renaming:")
+    ascended_cookies_renamed = df[ascended_mask]
+    for idx, row in ascended_cookies_renamed.iterrows():
+        report(f"  - {row['cookie_name']} ({row['cookie_rarity']})")
 
-# Rename Ascended cookies by appending (Ascended) to their names
-df.loc[ascended_mask, 'cookie_name'] = df.loc[ascended_mask, 'cookie_name'] + ' (Ascended)'
+    # Check for duplicates
+    duplicates = df[df.duplicated(subset=['cookie_name'], keep=False)]
+    if len(duplicates) > 0:
+        report(f"\n⚠️ WARNING: Still found {len(duplicates)} duplicate cookie names:")
+        report(duplicates[['cookie_name', 'cookie_rarity']].to_string())
+    else:
+        report(f"\n✓ No duplicate cookie names found!")
 
-# Also simplify the rarity from "Ancient (Ascended)" to just "Ancient (Ascended)"
-# Keep it as is for now to maintain the distinction
+    # Save the fixed CSV (every Ascended row was renamed, so skip the rewrite if there were none)
+    if mask.any():
+        df.to_csv('crk-cookies.csv', index=False, encoding='utf-8-sig')
+        report(f"\n✓ Saved fixed CSV to crk-cookies.csv")
+    else:
+        report(f"\n✓ No Ascended cookies to rename, crk-cookies.csv left as is")
+    report(f"Total cookies after fix: {len(df)}")
 
-print(f"\nAfter renaming:")
-ascended_cookies_renamed = df[ascended_mask]
-for idx, row in ascended_cookies_renamed.iterrows():
-    print(f"  - {row['cookie_name']} ({row['cookie_rarity']})")
+    sys.stdout.write(buf.getvalue())
 
-# Check for duplicates
-duplicates = df[df.duplicated(subset=['cookie_name'], keep=False)]
-if len(duplicates) > 0:
-    print(f"\n⚠️ WARNING: Still found {len(duplicates)} duplicate cookie names:")
-    print(duplicates[['cookie_name', 'cookie_rarity']].to_string())
-else:
-    print(f"\n✓ No duplicate cookie names found!")
 
-# Save the fixed CSV
-df.to_csv('crk-cookies.csv', index=False, encoding='utf-8-sig')
-print(f"\n✓ Saved fixed CSV to crk-cookies.csv")
-print(f"Total cookies after fix: {len(df)}")
+if __name__ == "__main__":
+    main()
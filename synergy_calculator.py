@@ -17,7 +17,8 @@ Synergy Score (0-100):
 
 from typing import List, Dict, Tuple, Optional
 from collections import Counter
-from team_optimizer import Cookie, Team
+from itertools import combinations
+from team_optimizer import Cookie, Team, TANK_ROLE_MASK, HEALER_ROLE_MASK, DPS_ROLE_MASK
 
 
 # Role Synergy Matrix - How well roles work together (0.0 to 1.0)
@@ -108,6 +109,13 @@ ROLE_SYNERGY_MATRIX = {
     }
 }
 
+# Flat (role1, role2) -> synergy view of ROLE_SYNERGY_MATRIX, one lookup per cookie pair
+ROLE_PAIR_SYNERGY = {
+    (role1, role2): value
+    for role1, row in ROLE_SYNERGY_MATRIX.items()
+    for role2, value in row.items()
+}
+
 # Elemental synergy bonus multiplier (same element teams get bonus)
 ELEMENT_BONUS_MULTIPLIER = 1.15  # 15% bonus per matching element
 
@@ -121,6 +129,7 @@ class SynergyCalculator:
     def __init__(self):
         """Initialize the synergy calculator."""
         self.role_matrix = ROLE_SYNERGY_MATRIX
+        self.role_pairs = ROLE_PAIR_SYNERGY
         self.element_multiplier = ELEMENT_BONUS_MULTIPLIER
         self.type_threshold = TYPE_SYNERGY_THRESHOLD
 
@@ -166,10 +175,10 @@ class SynergyCalculator:
 
         # 1. CC + Burst Damage synergy (0-1.5 points)
         # Crowd control enables burst damage to hit safely
-        if cookie1.crowd_control and cookie1.crowd_control != 'None':
+        if cookie1.has_cc:
             if cookie2.skill_type == 'Damage':
                 synergy_score += 1.5
-        elif cookie2.crowd_control and cookie2.crowd_control != 'None':
+        elif cookie2.has_cc:
             if cookie1.skill_type == 'Damage':
                 synergy_score += 1.5
 
@@ -182,10 +191,10 @@ class SynergyCalculator:
 
         # 3. Immunity + Dispel synergy (0-1.0 points)
         # Comprehensive debuff protection
-        if cookie1.grants_immunity and cookie1.grants_immunity != 'None':
+        if cookie1.has_grants_immunity:
             if cookie2.dispel:
                 synergy_score += 1.0
-        elif cookie2.grants_immunity and cookie2.grants_immunity != 'None':
+        elif cookie2.has_grants_immunity:
             if cookie1.dispel:
                 synergy_score += 1.0
 
@@ -228,17 +237,12 @@ class SynergyCalculator:
 
         # 1. ROLE SYNERGY (0-30 points)
         # Calculate average pairwise role synergy
+        pair_synergy = self.role_pairs
         role_pairs = []
-        for i in range(len(team.cookies)):
-            for j in range(i + 1, len(team.cookies)):
-                cookie1 = team.cookies[i]
-                cookie2 = team.cookies[j]
-
-                role1 = cookie1.role
-                role2 = cookie2.role
-
-                if role1 in self.role_matrix and role2 in self.role_matrix[role1]:
-                    role_pairs.append(self.role_matrix[role1][role2])
+        for pair in combinations([cookie.role for cookie in team.cookies], 2):
+            value = pair_synergy.get(pair)
+            if value is not None:
+                role_pairs.append(value)
 
         if role_pairs:
             avg_role_synergy = sum(role_pairs) / len(role_pairs)
@@ -312,15 +316,15 @@ class SynergyCalculator:
         coverage_score = 0.0
 
         # Has tank
-        if any(role in role_dist for role in ['Defense', 'Charge']):
+        if team.role_mask & TANK_ROLE_MASK:
             coverage_score += 3.0
 
         # Has healer
-        if any(role in role_dist for role in ['Healing', 'Support']):
+        if team.role_mask & HEALER_ROLE_MASK:
             coverage_score += 3.0
 
         # Has DPS
-        if any(role in role_dist for role in ['Magic', 'Ranged', 'Bomber', 'Ambush']):
+        if team.role_mask & DPS_ROLE_MASK:
             coverage_score += 2.0
 
         # Role diversity bonus
@@ -334,11 +338,11 @@ class SynergyCalculator:
         ability_score = 0.0
 
         # Count cookies with specific abilities
-        has_cc = any(c.crowd_control and c.crowd_control != 'None' for c in team.cookies)
+        has_cc = any(c.has_cc for c in team.cookies)
         has_burst_damage = any(c.skill_type == 'Damage' for c in team.cookies)
         has_healing = any(c.provides_healing for c in team.cookies)
         has_shield = any(c.provides_shield for c in team.cookies)
-        has_immunity = any(c.grants_immunity and c.grants_immunity != 'None' for c in team.cookies)
+        has_immunity = any(c.has_grants_immunity for c in team.cookies)
         has_dispel = any(c.dispel for c in team.cookies)
         num_anti_tank = sum(1 for c in team.cookies if c.anti_tank)
 
@@ -394,16 +398,23 @@ class SynergyCalculator:
 
         suggestions = []
 
+        # Per-selected-cookie data, gathered once instead of per candidate
+        selected_names = frozenset(c.name for c in selected_cookies)
+        selected_info = [(c, getattr(c, 'element', 'N/A'), c.role) for c in selected_cookies]
+        pair_synergy = self.role_pairs
+
         for cookie in all_cookies:
             # Skip if already selected
-            if cookie.name in [c.name for c in selected_cookies]:
+            if cookie.name in selected_names:
                 continue
 
             # Calculate average synergy with selected cookies
             synergy_scores = []
             reasons = []
+            cookie_element = getattr(cookie, 'element', 'N/A')
+            role2 = cookie.role
 
-            for selected in selected_cookies:
+            for selected, selected_element, role1 in selected_info:
                 score = self.calculate_cookie_synergy(selected, cookie)
                 synergy_scores.append(score)
 
@@ -411,19 +422,14 @@ class SynergyCalculator:
                 reason_parts = []
 
                 # Check element matching
-                selected_element = getattr(selected, 'element', 'N/A')
-                cookie_element = getattr(cookie, 'element', 'N/A')
                 if selected_element != 'N/A' and cookie_element != 'N/A':
                     if selected_element == cookie_element:
                         reason_parts.append(f"Same element ({cookie_element})")
 
                 # Check role synergy
-                role1 = selected.role
-                role2 = cookie.role
-                if role1 in self.role_matrix and role2 in self.role_matrix[role1]:
-                    synergy_value = self.role_matrix[role1][role2]
-                    if synergy_value >= 0.9:
-                        reason_parts.append(f"{role2} complements {role1}")
+                synergy_value = pair_synergy.get((role1, role2))
+                if synergy_value is not None and synergy_value >= 0.9:
+                    reason_parts.append(f"{role2} complements {role1}")
 
                 if reason_parts:
                     reasons.append(", ".join(reason_parts))
@@ -492,11 +498,11 @@ class SynergyCalculator:
         # Ability synergy
         explanation += f"\n💫 Ability Synergy: {breakdown['ability_synergy']:.1f}/10\n"
         ability_features = []
-        has_cc = any(c.crowd_control and c.crowd_control != 'None' for c in team.cookies)
+        has_cc = any(c.has_cc for c in team.cookies)
         has_burst = any(c.skill_type == 'Damage' for c in team.cookies)
         has_healing = any(c.provides_healing for c in team.cookies)
         has_shield = any(c.provides_shield for c in team.cookies)
-        has_immunity = any(c.grants_immunity and c.grants_immunity != 'None' for c in team.cookies)
+        has_immunity = any(c.has_grants_immunity for c in team.cookies)
         has_dispel = any(c.dispel for c in team.cookies)
 
         if has_cc and has_burst:
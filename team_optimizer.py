@@ -10,10 +10,11 @@ Supports two modes:
 - Advanced Mode: Personalized scoring with cookie levels, skill levels, and toppings
 """
 
+import heapq
 import pandas as pd
 import random
 import json
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Set, Tuple
 from collections import Counter
 from cookie_analysis import load_data
 
@@ -32,6 +33,61 @@ RARITY_WEIGHTS = {
     'Common': 0.5
 }
 
+# One bit per role so team role coverage is a single OR-ed mask (see Team.role_mask)
+ROLE_BITS = {
+    'Defense': 1,
+    'Charge': 2,
+    'Healing': 4,
+    'Support': 8,
+    'Magic': 16,
+    'Ranged': 32,
+    'Bomber': 64,
+    'Ambush': 128
+}
+TANK_ROLE_MASK = ROLE_BITS['Defense'] | ROLE_BITS['Charge']
+HEALER_ROLE_MASK = ROLE_BITS['Healing'] | ROLE_BITS['Support']
+DPS_ROLE_MASK = ROLE_BITS['Magic'] | ROLE_BITS['Ranged'] | ROLE_BITS['Bomber'] | ROLE_BITS['Ambush']
+
+# Named team combos scored by Team.special_combo_score
+SPECIAL_COMBO_BONUSES = {
+    'Citrus Party': {
+        'required': {'Lemon Cookie'},
+        'optional': {'Orange Cookie', 'Lime Cookie', 'Grapefruit Cookie'},
+        'min_members': 2,
+        'bonus': 20.0
+    },
+    'The Protector of the Golden City': {
+        'required': {'Golden Cheese Cookie'},
+        'optional': {'Burnt Cheese Cookie', 'Smoked Cheese Cookie'},
+        'min_members': 2,
+        'bonus': 15.0
+    },
+    'Silver Knighthood': {
+        'required': {'Mercurial Knight Cookie', 'Silverbell Cookie'},
+        'bonus': 25.0
+    },
+    'Team Drizzle': {
+        'required': {'Choco Drizzle Cookie', 'Green Tea Mousse Cookie', 'Pudding à la Mode Cookie'},
+        'bonus': 25.0
+    },
+    'The Deceitful Trio': {
+        'required': {'Shadow Milk Cookie', 'Black Sapphire Cookie', 'Candy Apple Cookie'},
+        'bonus': 25.0
+    }
+}
+
+# SPECIAL_COMBO_BONUSES flattened once into (required, all members, min members, bonus)
+# rows; combos without optional members need every required cookie
+_SPECIAL_COMBO_TABLE = tuple(
+    (
+        frozenset(combo['required']),
+        frozenset(combo['required'] | combo.get('optional', set())),
+        combo.get('min_members', len(combo['required'])),
+        combo['bonus'],
+    )
+    for combo in SPECIAL_COMBO_BONUSES.values()
+)
+
 
 class Treasure:
     """Represents a treasure with buffs and effects for the team."""
@@ -227,6 +283,7 @@ class Cookie:
         self.name = name
         self.rarity = rarity
         self.role = role
+        self.role_bit = ROLE_BITS.get(role, 0)
         self.position = position
         self.element = element if element and element != 'N/A' else None
         self.cookie_level = cookie_level
@@ -238,6 +295,9 @@ class Cookie:
         self.skill_type = skill_type
         self.crowd_control = crowd_control if crowd_control != 'None' else None
         self.grants_immunity = grants_immunity if grants_immunity != 'None' else None
+        # Presence flags for scoring hot paths ('None' is already normalized to None)
+        self.has_cc = bool(self.crowd_control)
+        self.has_grants_immunity = bool(self.grants_immunity)
         self.provides_healing = provides_healing
         self.provides_shield = provides_shield
         self.anti_heal = anti_heal
@@ -259,19 +319,27 @@ class Cookie:
         self.synergy_groups = synergy_groups if synergy_groups else []
         self.special_combos = special_combos if special_combos else []
 
+        # Power score cache, filled by get_power_score
+        self._power_score = None
+
     def get_power_score(self) -> float:
         """
         Calculate and return the power score for this cookie.
 
+        The score is computed once and cached; set _power_score back to None
+        after changing rarity or progression stats (update_cookie_stats does this).
+
         Returns:
             float: Power score (0-7 scale)
         """
-        # Check if any advanced stats are provided
-        if any([self.cookie_level, self.skill_level, self.topping_quality]):
-            return self._calculate_advanced_score()
-        else:
-            # Basic mode: rarity-only
-            return RARITY_WEIGHTS.get(self.rarity, 1.0)
+        if self._power_score is None:
+            # Check if any advanced stats are provided
+            if any([self.cookie_level, self.skill_level, self.topping_quality]):
+                self._power_score = self._calculate_advanced_score()
+            else:
+                # Basic mode: rarity-only
+                self._power_score = RARITY_WEIGHTS.get(self.rarity, 1.0)
+        return self._power_score
 
     def _calculate_advanced_score(self) -> float:
         """
@@ -356,6 +424,12 @@ class Team:
         """
         self.cookies = cookies
         self.treasures = treasures if treasures else []
+        self._role_distribution = None
+
+        # OR of the cookies' ROLE_BITS, for role-coverage checks
+        self.role_mask = 0
+        for cookie in cookies:
+            self.role_mask |= cookie.role_bit
         self.include_synergy = include_synergy
         self.strict_validation = strict_validation
         self.validate()
@@ -513,8 +587,7 @@ class Team:
             bonus += 3.0
 
         # +2 for having damage dealers
-        damage_roles = {'Magic', 'Ranged', 'Bomber', 'Ambush'}
-        if any(cookie.role in damage_roles for cookie in self.cookies):
+        if self.role_mask & DPS_ROLE_MASK:
             bonus += 2.0
 
         return bonus
@@ -582,10 +655,7 @@ class Team:
         # Summon boost bonus
         if any(t.summon_boost for t in self.treasures):
             # Check if team has summoners
-            has_summoner = any(
-                c.skill_type == 'Summon' if hasattr(c, 'skill_type') and c.skill_type else False
-                for c in self.cookies
-            )
+            has_summoner = any(c.skill_type == 'Summon' for c in self.cookies)
             if has_summoner:
                 special_bonus += 0.8  # Big bonus if team has summoners
             else:
@@ -597,7 +667,10 @@ class Team:
 
     def get_role_distribution(self) -> Dict[str, int]:
         """Get count of each role in the team."""
-        return dict(Counter(cookie.role for cookie in self.cookies))
+        # Counted once per team; callers get a copy they are free to modify
+        if self._role_distribution is None:
+            self._role_distribution = dict(Counter(cookie.role for cookie in self.cookies))
+        return dict(self._role_distribution)
 
     def get_position_distribution(self) -> Dict[str, int]:
         """Get count of each position in the team."""
@@ -653,51 +726,19 @@ class Team:
         Detect special combo activation (0-25 points).
         Recognizes named team combos like Citrus Party, Silver Knighthood, etc.
         """
-        combo_bonuses = {
-            'Citrus Party': {
-                'required': {'Lemon Cookie'},
-                'optional': {'Orange Cookie', 'Lime Cookie', 'Grapefruit Cookie'},
-                'min_members': 2,
-                'bonus': 20.0
-            },
-            'The Protector of the Golden City': {
-                'required': {'Golden Cheese Cookie'},
-                'optional': {'Burnt Cheese Cookie', 'Smoked Cheese Cookie'},
-                'min_members': 2,
-                'bonus': 15.0
-            },
-            'Silver Knighthood': {
-                'required': {'Mercurial Knight Cookie', 'Silverbell Cookie'},
-                'bonus': 25.0
-            },
-            'Team Drizzle': {
-                'required': {'Choco Drizzle Cookie', 'Green Tea Mousse Cookie', 'Pudding à la Mode Cookie'},
-                'bonus': 25.0
-            },
-            'The Deceitful Trio': {
-                'required': {'Shadow Milk Cookie', 'Black Sapphire Cookie', 'Candy Apple Cookie'},
-                'bonus': 25.0
-            }
-        }
-
         cookie_names = {c.name for c in self.cookies}
         max_bonus = 0.0
 
-        for combo_name, combo_data in combo_bonuses.items():
-            required = combo_data['required']
+        for required, members, min_members, bonus in _SPECIAL_COMBO_TABLE:
+            # Skip combos that cannot raise the current best
+            if bonus <= max_bonus:
+                continue
 
             # Check if all required cookies are present
             if required.issubset(cookie_names):
                 # Check for minimum members requirement (for combos with optional members)
-                if 'min_members' in combo_data:
-                    optional = combo_data.get('optional', set())
-                    all_members = required | optional
-                    present_members = cookie_names & all_members
-                    if len(present_members) >= combo_data['min_members']:
-                        max_bonus = max(max_bonus, combo_data['bonus'])
-                else:
-                    # All required present, activate bonus
-                    max_bonus = max(max_bonus, combo_data['bonus'])
+                if len(cookie_names & members) >= min_members:
+                    max_bonus = bonus
 
         return max_bonus
 
@@ -717,14 +758,14 @@ class Team:
 
     def has_tank(self) -> bool:
         """Check if team has a tank (Defense or Charge in Front)."""
-        return any(
-            cookie.position == 'Front' and cookie.role in {'Defense', 'Charge'}
+        return bool(self.role_mask & TANK_ROLE_MASK) and any(
+            cookie.position == 'Front' and cookie.role_bit & TANK_ROLE_MASK
             for cookie in self.cookies
         )
 
     def has_healer(self) -> bool:
         """Check if team has a healer (Healing or Support)."""
-        return any(cookie.role in {'Healing', 'Support'} for cookie in self.cookies)
+        return bool(self.role_mask & HEALER_ROLE_MASK)
 
     def __repr__(self) -> str:
         """String representation of the team."""
@@ -1036,6 +1077,27 @@ class TeamOptimizer:
                 cookie.cookie_level = stats.get('cookie_level')
                 cookie.skill_level = stats.get('skill_level')
                 cookie.topping_quality = stats.get('topping_quality')
+                cookie._power_score = None
+
+    def _split_required(self, required_cookies: Optional[List[str]] = None) -> Tuple[List[Cookie], List[Cookie]]:
+        """
+        Split all_cookies into required cookies and the pool for the remaining slots.
+
+        Args:
+            required_cookies: Optional list of cookie names that MUST be in every team
+
+        Returns:
+            Tuple of (required cookies, other cookies), both in all_cookies order
+        """
+        required_names = set(required_cookies) if required_cookies else set()
+        required = []
+        available = []
+        for cookie in self.all_cookies:
+            if cookie.name in required_names:
+                required.append(cookie)
+            else:
+                available.append(cookie)
+        return required, available
 
     def generate_random_teams(self, n: int = 100, required_cookies: Optional[List[str]] = None) -> List[Team]:
         """
@@ -1050,16 +1112,11 @@ class TeamOptimizer:
         """
         teams = []
 
-        # Get required cookie objects
-        required = []
-        if required_cookies:
-            required = [c for c in self.all_cookies if c.name in required_cookies]
-            if len(required) != len(required_cookies):
-                missing = set(required_cookies) - {c.name for c in required}
-                raise ValueError(f"Required cookies not found: {missing}")
-
-        # Get available cookies for random selection (exclude required ones)
-        available = [c for c in self.all_cookies if c.name not in (required_cookies or [])]
+        # Get required cookie objects and the pool for random selection (one pass)
+        required, available = self._split_required(required_cookies)
+        if required_cookies and len(required) != len(required_cookies):
+            missing = set(required_cookies) - {c.name for c in required}
+            raise ValueError(f"Required cookies not found: {missing}")
 
         # Calculate how many more cookies needed
         slots_to_fill = 5 - len(required)
@@ -1069,6 +1126,10 @@ class TeamOptimizer:
         if slots_to_fill > len(available):
             raise ValueError(f"Not enough cookies to fill team. Need {slots_to_fill}, have {len(available)}.")
 
+        # Teams already scored in this call, keyed by cookie order; repeated draws
+        # (common when required cookies leave few open slots) reuse the same Team
+        built: Dict[Tuple[str, ...], Team] = {}
+
         for _ in range(n):
             # Start with required cookies
             selected_cookies = required.copy()
@@ -1077,12 +1138,16 @@ class TeamOptimizer:
             if slots_to_fill > 0:
                 selected_cookies.extend(random.sample(available, slots_to_fill))
 
-            try:
-                team = Team(selected_cookies)
-                teams.append(team)
-            except ValueError:
-                # Skip invalid teams (shouldn't happen with random.sample)
-                continue
+            key = tuple(c.name for c in selected_cookies)
+            team = built.get(key)
+            if team is None:
+                try:
+                    team = Team(selected_cookies)
+                except ValueError:
+                    # Skip invalid teams (shouldn't happen with random.sample)
+                    continue
+                built[key] = team
+            teams.append(team)
 
         return teams
 
@@ -1118,16 +1183,18 @@ class TeamOptimizer:
         else:
             raise ValueError(f"Unknown method: {method}. Use 'random', 'greedy', 'genetic', 'synergy', or 'exhaustive'")
 
-        # Remove duplicate teams (same cookies, different order)
-        unique_teams = list(set(teams))
+        # Remove duplicate teams (same cookies, different order); exhaustive
+        # combinations are distinct by construction, so skip hashing them
+        if method == 'exhaustive':
+            unique_teams = teams
+        else:
+            unique_teams = list(set(teams))
 
-        # Sort by score descending and return top N
+        # Select the top N by score descending (ties keep list order, like a stable sort)
         # For synergy method, prioritize total_synergy_score, then composition_score
         if method == 'synergy':
-            unique_teams.sort(key=lambda t: (t.total_synergy_score, t.composition_score), reverse=True)
-        else:
-            unique_teams.sort(key=lambda t: t.composition_score, reverse=True)
-        return unique_teams[:n]
+            return heapq.nlargest(n, unique_teams, key=lambda t: (t.total_synergy_score, t.composition_score))
+        return heapq.nlargest(n, unique_teams, key=lambda t: t.composition_score)
 
     def _generate_greedy_teams(self, n: int, required_cookies: Optional[List[str]] = None) -> List[Team]:
         """
@@ -1140,16 +1207,12 @@ class TeamOptimizer:
         Returns:
             List[Team]: Generated teams
         """
-        # Get required cookie objects
-        required = []
-        if required_cookies:
-            required = [c for c in self.all_cookies if c.name in required_cookies]
+        # Get required cookie objects; the rest are candidates
+        required, available = self._split_required(required_cookies)
 
-        # Sort cookies by power score descending
-        sorted_cookies = sorted(self.all_cookies, key=lambda c: c.get_power_score(), reverse=True)
-
-        # Remove required cookies from sorted list to avoid duplicates
-        available_sorted = [c for c in sorted_cookies if c not in required]
+        # Sort candidates by power score descending (stable, so ties keep all_cookies order)
+        available_sorted = sorted(available, key=lambda c: c.get_power_score(), reverse=True)
+        half = len(available_sorted) // 2
 
         teams = []
         slots_to_fill = 5 - len(required)
@@ -1166,7 +1229,8 @@ class TeamOptimizer:
                     team_cookies.append(random.choice(available_sorted[:max(1, len(available_sorted))]))
 
                 # Fill remaining slots with random selection from top 50%
-                remaining = [c for c in available_sorted if c not in team_cookies][:len(available_sorted)//2]
+                picked_name = team_cookies[-1].name
+                remaining = [c for c in available_sorted if c.name != picked_name][:half]
                 needed = min(slots_to_fill - 1, len(remaining))
                 if needed > 0:
                     team_cookies.extend(random.sample(remaining, needed))
@@ -1199,13 +1263,13 @@ class TeamOptimizer:
         # Initialize population with random teams
         population = self.generate_random_teams(population_size, required_cookies=required_cookies)
 
-        for generation in range(generations):
-            # Sort by fitness (team score)
-            population.sort(key=lambda t: t.composition_score, reverse=True)
+        # Crossover and mutation only test membership, so give them a set
+        required_names = set(required_cookies) if required_cookies else None
 
-            # Keep top 20% as elites
+        for generation in range(generations):
+            # Keep top 20% by fitness (team score) as elites
             elite_count = max(2, population_size // 5)
-            elites = population[:elite_count]
+            elites = heapq.nlargest(elite_count, population, key=lambda t: t.composition_score)
 
             # Create next generation
             next_generation = elites.copy()
@@ -1217,12 +1281,12 @@ class TeamOptimizer:
 
                 # Crossover: combine cookies from both parents
                 child_cookies = self._crossover_teams(
-                    parent1, parent2, required_cookies=required_cookies
+                    parent1, parent2, required_cookies=required_names
                 )
 
                 # Mutation: randomly replace a cookie (10% chance)
                 if random.random() < 0.1:
-                    child_cookies = self._mutate_team(child_cookies, required_cookies=required_cookies)
+                    child_cookies = self._mutate_team(child_cookies, required_cookies=required_names)
 
                 try:
                     child_team = Team(child_cookies)
@@ -1239,7 +1303,7 @@ class TeamOptimizer:
         self,
         team1: Team,
         team2: Team,
-        required_cookies: Optional[List[str]] = None
+        required_cookies: Optional[Set[str]] = None
     ) -> List[Cookie]:
         """
         Crossover operation: combine cookies from two parent teams.
@@ -1273,7 +1337,9 @@ class TeamOptimizer:
             # Not enough cookies from parents, add random ones
             selected = available.copy()
             remaining_slots = slots_to_fill - len(selected)
-            extra_cookies = [c for c in self.all_cookies if c not in selected and c not in required]
+            taken = {c.name for c in selected}
+            taken.update(c.name for c in required)
+            extra_cookies = [c for c in self.all_cookies if c.name not in taken]
             selected.extend(random.sample(extra_cookies, remaining_slots))
 
         return required + selected
@@ -1281,7 +1347,7 @@ class TeamOptimizer:
     def _mutate_team(
         self,
         cookies: List[Cookie],
-        required_cookies: Optional[List[str]] = None
+        required_cookies: Optional[Set[str]] = None
     ) -> List[Cookie]:
         """
         Mutation operation: randomly replace one cookie (not required ones).
@@ -1303,7 +1369,8 @@ class TeamOptimizer:
         to_replace = random.choice(mutable_cookies)
 
         # Find a replacement cookie not already in team
-        available = [c for c in self.all_cookies if c not in cookies]
+        team_names = {c.name for c in cookies}
+        available = [c for c in self.all_cookies if c.name not in team_names]
 
         if not available:
             return cookies  # No alternatives available
@@ -1330,13 +1397,8 @@ class TeamOptimizer:
         """
         from itertools import combinations
 
-        # Get required cookies
-        required = []
-        if required_cookies:
-            required = [c for c in self.all_cookies if c.name in required_cookies]
-
-        # Get available cookies for combinations
-        available = [c for c in self.all_cookies if c not in required]
+        # Get required cookies and the pool for combinations
+        required, available = self._split_required(required_cookies)
 
         # Calculate slots to fill
         slots_to_fill = 5 - len(required)
@@ -1357,10 +1419,8 @@ class TeamOptimizer:
 
         teams = []
         for combo in combinations(available, slots_to_fill):
-            team_cookies = required + list(combo)
             try:
-                team = Team(team_cookies)
-                teams.append(team)
+                teams.append(Team([*required, *combo]))
             except ValueError:
                 continue
 
@@ -1418,9 +1478,7 @@ class TeamOptimizer:
         used_combinations = set()
 
         # Get required cookies
-        required = []
-        if required_cookies:
-            required = [c for c in self.all_cookies if c.name in required_cookies]
+        required, _ = self._split_required(required_cookies)
 
         # Strategy 1: Build teams around special combos
         special_combo_teams = self._build_special_combo_teams(required, n // 3)
@@ -1678,19 +1736,18 @@ class TeamOptimizer:
             score += tier_base.get(treasure.tier_ranking, 2.0)
 
             # Check archetype compatibility
-            role_dist = team.get_role_distribution()
             team_archetypes = set()
 
             # Determine team archetypes
-            if any(role in role_dist for role in ['Magic', 'Ranged', 'Bomber', 'Ambush']):
+            if team.role_mask & DPS_ROLE_MASK:
                 team_archetypes.add('DPS')
-            if any(role in role_dist for role in ['Defense', 'Charge']):
+            if team.role_mask & TANK_ROLE_MASK:
                 team_archetypes.add('Tank')
-            if any(role in role_dist for role in ['Healing', 'Support']):
+            if team.role_mask & HEALER_ROLE_MASK:
                 team_archetypes.add('Sustain')
 
             # Check for summoners
-            if any(c.skill_type == 'Summon' if hasattr(c, 'skill_type') and c.skill_type else False for c in team.cookies):
+            if any(c.skill_type == 'Summon' for c in team.cookies):
                 team_archetypes.add('Summoner')
 
             # Universal treasures get bonus for any team
@@ -1720,7 +1777,7 @@ class TeamOptimizer:
                     reasons.append("Revival protects vulnerable backline")
 
             # Healing/Shield synergy
-            has_healer = any(c.provides_healing if hasattr(c, 'provides_healing') else False for c in team.cookies)
+            has_healer = any(c.provides_healing for c in team.cookies)
             if treasure.hp_shield_max > 0 or treasure.heal_max > 0:
                 if has_healer:
                     score += 3.0
@@ -1741,9 +1798,8 @@ class TeamOptimizer:
             reason = reasons[0] if reasons else "Standard treasure"
             treasure_scores.append((treasure, score, reason))
 
-        # Sort by score and return top N
-        treasure_scores.sort(key=lambda x: x[1], reverse=True)
-        return treasure_scores[:top_n]
+        # Return top N by score
+        return heapq.nlargest(top_n, treasure_scores, key=lambda x: x[1])
 
     def export_teams(self, teams: List[Team], filepath: str, format: str = 'json'):
         """
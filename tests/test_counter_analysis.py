@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Test enemy-team analysis: batch vs single-team results and cache invalidation."""
+
+import copy
+
+from team_optimizer import TeamOptimizer, Team
+from counter_team_generator import CounterTeamGenerator
+
+# Load optimizer
+optimizer = TeamOptimizer('crk-cookies.csv')
+
+
+def build_team(names):
+    """Build a Team from cookie names (None if any cookie is missing)."""
+    cookies = [next((c for c in optimizer.all_cookies if c.name == name), None) for name in names]
+    return Team(cookies) if all(cookies) else None
+
+
+lineups = [
+    ['Pure Vanilla Cookie', 'Shadow Milk Cookie', 'Cream Ferret Cookie',
+     'Hollyberry Cookie', 'Parfait Cookie'],
+    ['Shadow Milk Cookie', 'Black Pearl Cookie', 'Frost Queen Cookie',
+     'Pure Vanilla Cookie', 'Dark Cacao Cookie'],
+    # Same cookies as the first lineup in another order
+    ['Hollyberry Cookie', 'Parfait Cookie', 'Pure Vanilla Cookie',
+     'Shadow Milk Cookie', 'Cream Ferret Cookie'],
+]
+enemy_teams = [build_team(names) for names in lineups]
+# Repeat the first lineup to exercise de-duplication inside the batch
+enemy_teams.append(build_team(lineups[0]))
+
+if all(enemy_teams):
+    print("="*70)
+    print("ENEMY ANALYSIS TEST")
+    print("="*70)
+    print()
+
+    batch = CounterTeamGenerator(optimizer).analyze_enemy_teams_batch(enemy_teams)
+    assert len(batch) == len(enemy_teams)
+
+    # A separate generator so the scalar results are not served from the batch's cache
+    scalar_generator = CounterTeamGenerator(optimizer)
+    for i, (enemy_team, analysis) in enumerate(zip(enemy_teams, batch), 1):
+        expected = scalar_generator.analyze_enemy_team(enemy_team)
+        assert analysis == expected, f"Team #{i}: batch result differs from analyze_enemy_team"
+        print(f"✓ Team #{i}: batch matches analyze_enemy_team "
+              f"({analysis['healers']} healers, {analysis['tanks']} tanks)")
+
+    assert batch[3] == batch[0] and batch[3] is not batch[0]
+    print("✓ Repeated lineup gets an equal, separate result")
+
+    # Callers may modify their result without touching the cached analysis
+    generator = CounterTeamGenerator(optimizer)
+    first = generator.analyze_enemy_team(enemy_teams[0])
+    first['healers'] = -1
+    first['healer_list'].append('Not A Real Cookie')
+    again = generator.analyze_enemy_team(enemy_teams[0])
+    assert again == scalar_generator.analyze_enemy_team(enemy_teams[0]), "Cached analysis was modified"
+    print("✓ Modifying a returned analysis leaves the cache intact")
+
+    # Reassigning the pool drops cached analyses: swap in a Pure Vanilla Cookie that is not a healer
+    original_pool = generator.all_cookies
+    healer = next(c for c in enemy_teams[1].cookies if c.name == 'Pure Vanilla Cookie')
+    before = generator.analyze_enemy_team(enemy_teams[1])
+    assert 'Pure Vanilla Cookie' in before['healer_list']
+
+    non_healer = copy.copy(healer)
+    non_healer.role = 'Charge'
+    non_healer.provides_healing = False
+    generator.all_cookies = [non_healer if c is healer else c for c in original_pool]
+    swapped_team = Team([non_healer if c is healer else c for c in enemy_teams[1].cookies])
+    after = generator.analyze_enemy_team(swapped_team)
+    print(f"Healers before pool swap: {before['healers']}, after: {after['healers']}")
+    assert 'Pure Vanilla Cookie' not in after['healer_list'], "Stale analysis survived the pool swap"
+    assert after == CounterTeamGenerator(optimizer).analyze_enemy_team(swapped_team)
+    print("✓ Reassigning all_cookies refreshes enemy analyses")
+else:
+    print("✗ Test cookies NOT found!")
+
+print()
+print("="*70)
+print("✓ All enemy analysis tests complete!")
+print("="*70)
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""Test roster-wide Guild Battle scoring against per-cookie scoring."""
+
+from team_optimizer import TeamOptimizer
+from guild_battle_optimizer import GuildBattleOptimizer, GUILD_BOSSES
+
+# Load optimizer
+optimizer = TeamOptimizer('crk-cookies.csv')
+
+print("="*70)
+print("GUILD BATTLE BATCH SCORING TEST")
+print("="*70)
+print()
+
+for boss_name in list(GUILD_BOSSES) + ['Unknown Boss']:
+    for prioritize_s_tier in (True, False):
+        # Batch first on one optimizer, per-cookie on a fresh one, so neither reads the other's cache
+        batch = GuildBattleOptimizer(optimizer).score_all_cookies_for_boss(boss_name, prioritize_s_tier)
+        scalar_optimizer = GuildBattleOptimizer(optimizer)
+
+        assert len(batch) == len(optimizer.all_cookies), f"{boss_name}: batch is missing cookies"
+        for cookie, score in zip(optimizer.all_cookies, batch):
+            expected = scalar_optimizer.score_cookie_for_boss(cookie, boss_name, prioritize_s_tier)
+            assert score == expected, f"{boss_name} / {cookie.name}: batch {score} != {expected}"
+        print(f"✓ {boss_name} (prioritize_s_tier={prioritize_s_tier}): "
+              f"{len(batch)} batch scores match score_cookie_for_boss")
+
+print()
+print("="*70)
+print("✓ All guild battle scoring tests complete!")
+print("="*70)
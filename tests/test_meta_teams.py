@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Test meta team identification and the cookie/treasure team indexes."""
+
+from meta_teams_database import (
+    META_TEAMS, COOKIE_TO_TEAMS, TREASURE_TO_TEAMS,
+    identify_likely_meta_team, get_meta_teams_with_cookie
+)
+
+print("="*70)
+print("META TEAM DATABASE TEST")
+print("="*70)
+print()
+
+# Test 1: Every meta team's own composition is matched back to that team
+for team_name, team in META_TEAMS.items():
+    lineup = list(team['typical_composition'])
+    matched = identify_likely_meta_team(lineup)
+    print(f"{team_name}: matched as {matched}")
+    assert matched == team_name, f"{team_name} composition matched {matched}"
+print("✓ Every typical composition matches its own meta team")
+print()
+
+# Test 2: Core cookies alone are enough to recognize a team
+matched = identify_likely_meta_team(['Black Pearl Cookie', 'Sea Fairy Cookie'])
+print(f"Black Pearl + Sea Fairy: matched as {matched}")
+assert matched == 'Black Pearl Hypercarry'
+print("✓ Core cookies identify Black Pearl Hypercarry")
+print()
+
+# Test 3: Lineups without any core cookie match nothing
+for lineup in ([], ['Not A Real Cookie'], ['Wind Archer']):
+    matched = identify_likely_meta_team(lineup)
+    print(f"{lineup}: matched as {matched}")
+    assert matched is None, f"{lineup} matched {matched}"
+print("✓ Lineups without core cookies are not matched")
+print()
+
+# Test 4: Inverted indexes agree with a linear scan of META_TEAMS
+for field, index in (('typical_composition', COOKIE_TO_TEAMS),
+                     ('recommended_treasures', TREASURE_TO_TEAMS)):
+    names = {name for team in META_TEAMS.values() for name in team[field]}
+    assert set(index) == names, f"{field} index keys differ"
+    for name in names:
+        expected = tuple(team_name for team_name, team in META_TEAMS.items() if name in team[field])
+        assert index[name] == expected, f"{name}: {index[name]} != {expected}"
+    print(f"✓ {field} index matches a scan of META_TEAMS ({len(names)} names)")
+
+# Test 5: Cookie lookup helper
+teams = get_meta_teams_with_cookie('Hollyberry Cookie (Ascended)')
+print(f"Hollyberry Cookie (Ascended) appears in: {teams}")
+assert teams == ('Silent Berry Milk', 'Millennial Tree Tank', 'Thunderstrike Team', 'Defensive Wall')
+assert get_meta_teams_with_cookie('Not A Real Cookie') == ()
+print("✓ get_meta_teams_with_cookie returns teams in META_TEAMS order")
+
+print()
+print("="*70)
+print("✓ All meta team tests complete!")
+print("="*70)
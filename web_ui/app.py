@@ -218,6 +218,7 @@ def optimize_teams():
             optimizer.all_cookies = original_cookies
 
         # Convert to JSON-friendly format
+        required_names = set(required_cookies or [])
         teams_data = []
         for i, team in enumerate(teams, 1):
             team_dict = {
@@ -249,7 +250,7 @@ def optimize_teams():
                     'power': round(cookie.get_power_score(), 2),
                     'color': RARITY_COLORS.get(cookie.rarity, '#808080'),
                     'image_url': get_cookie_image_url(cookie.name),
-                    'isRequired': cookie.name in (required_cookies or [])
+                    'isRequired': cookie.name in required_names
                 })
 
             teams_data.append(team_dict)
@@ -327,8 +328,8 @@ def generate_counter_teams():
 
         # Analyze enemy team
         analysis = counter_generator.analyze_enemy_team(enemy_team)
-        weaknesses = counter_generator.identify_weaknesses(enemy_team)
-        counter_strategy = counter_generator.generate_counter_strategies(enemy_team)
+        weaknesses = counter_generator.identify_weaknesses(enemy_team, analysis=analysis)
+        counter_strategy = counter_generator.generate_counter_strategies(enemy_team, analysis=analysis)
 
         # Apply max rarity filter if specified
         original_cookies = counter_generator.all_cookies